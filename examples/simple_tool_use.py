@@ -5,38 +5,41 @@
 """
 
 import asyncio
-from coding_agent.tools import AnthropicClient, ToolExecutor
+import sys
+import textwrap
+from coding_agent.tools import get_client_and_executor
+
+
+async def producer(client, messages, queue, tool_calls):
+    """把 LLM 的流式输出片段放入队列，结束时放入 None。"""
+    try:
+        async for chunk in client.stream_with_tools(
+            messages=messages,
+            max_tokens=4000,
+            tool_calls_made=tool_calls,
+        ):
+            await queue.put(chunk)
+    finally:
+        await queue.put(None)
+
+
+async def consumer(queue):
+    """从队列取出片段并立即输出。"""
+    while True:
+        chunk = await queue.get()
+        if chunk is None:
+            break
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
 
 
 async def main():
     """主函数。"""
     
-    # 1. 初始化客户端和执行器
-    client = AnthropicClient()
-    executor = ToolExecutor()
-    
-    # 2. 注册 code_runner 工具
-    client.register_tool(
-        name="code_runner",
-        description="代码执行器，支持运行 python 和 javascript 代码",
-        parameters={
-            "type": "object",
-            "properties": {
-                "language": {
-                    "type": "string",
-                    "enum": ["python", "javascript"]
-                },
-                "code": {
-                    "type": "string",
-                    "description": "代码写在这里"
-                }
-            },
-            "required": ["language", "code"]
-        },
-        function=executor.execute_code_runner,
-    )
+    # 1. 获取共享的客户端（已注册 code_runner 等默认工具）
+    client, _ = get_client_and_executor()
     
-    # 3. 发送请求（这是 Kimi 文档中的示例）
+    # 2. 发送请求（这是 Kimi 文档中的示例）
     messages = [
         {
             "role": "user",
@@ -46,43 +49,47 @@ async def main():
     
     print("🤖 发送请求: 编程判断 3214567 是否是素数。\n")
     
-    # 4. 调用 LLM（会自动使用工具）
-    result = await client.generate_with_tools(
-        messages=messages,
-        max_tokens=4000,
-    )
-    
-    # 5. 显示结果
+    # 3. 流式调用 LLM（会自动使用工具），边生成边显示
     print("=" * 60)
     print("📝 LLM 回复:")
     print("=" * 60)
-    print(result['content'])
-    print()
+    queue = asyncio.Queue()
+    tool_calls = []
+    await asyncio.gather(
+        producer(client, messages, queue, tool_calls),
+        consumer(queue),
+    )
+    print("\n")
     
-    # 6. 显示工具调用详情
-    if result['tool_calls']:
+    # 4. 显示工具调用详情
+    if tool_calls:
         print("=" * 60)
         print("🔧 工具调用详情:")
         print("=" * 60)
-        for i, call in enumerate(result['tool_calls'], 1):
+        for i, call in enumerate(tool_calls, 1):
             print(f"\n调用 #{i}: {call['name']}")
             print(f"输入参数:")
             for key, value in call['input'].items():
                 if key == 'code':
                     print(f"  {key}:")
-                    for line in value.split('\n'):
-                        print(f"    {line}")
+                    print(textwrap.indent(value, "    "))
                 else:
                     print(f"  {key}: {value}")
             print(f"\n执行结果:")
             if isinstance(call['result'], dict):
-                for key, value in call['result'].items():
-                    print(f"  {key}: {value}")
+                print("\n".join(f"  {key}: {value}" for key, value in call['result'].items()))
             else:
                 print(f"  {call['result']}")
 
 
 if __name__ == "__main__":
+    # 可选：使用 uvloop 降低事件循环开销
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except Exception as e:
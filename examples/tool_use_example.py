@@ -1,24 +1,27 @@
 """示例：如何使用 LLM 的 tools use 功能。
 
 这个示例展示了如何：
-1. 初始化 AnthropicClient
-2. 注册工具（web search, web crawler, code runner）
-3. 使用工具进行对话
+1. 获取共享的 AnthropicClient（工具已注册：web search, web crawler, code runner）
+2. 使用工具进行对话
 """
 
 import asyncio
 import os
-from coding_agent.tools import AnthropicClient, ToolExecutor
+from coding_agent.tools import get_client_and_executor
 
 
 async def main():
     """主函数：演示 tools use 功能。"""
     
-    # 1. 初始化 LLM 客户端
-    print("🚀 初始化 Anthropic/Kimi 客户端...")
+    # 1. 获取共享的 LLM 客户端和工具执行器
+    #    （web_search, web_crawl, code_runner 工具已在工厂中注册）
+    print("🚀 初始化 Anthropic/Kimi 客户端并注册工具...")
     try:
-        client = AnthropicClient()
-        print("✅ 客户端初始化成功\n")
+        client, executor = get_client_and_executor()
+        print("✅ 客户端初始化成功")
+        for name in client.tool_registry:
+            print(f"  ✅ 注册 {name} 工具")
+        print()
     except Exception as e:
         print(f"❌ 初始化失败: {e}")
         print("\n请确保设置了以下环境变量:")
@@ -27,84 +30,7 @@ async def main():
         print("  - ANTHROPIC_MODEL (可选)")
         return
 
-    # 2. 初始化工具执行器
-    print("🔧 初始化工具执行器...")
-    executor = ToolExecutor()
-    print("✅ 工具执行器初始化成功\n")
-
-    # 3. 注册工具
-    print("📝 注册工具...")
-    
-    # 注册 web search 工具
-    client.register_tool(
-        name="web_search",
-        description="搜索网络以查找相关信息。可以用于查找代码示例、文档、最佳实践等。",
-        parameters={
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "搜索查询字符串"
-                },
-                "max_results": {
-                    "type": "integer",
-                    "description": "返回的最大结果数量",
-                    "default": 5
-                }
-            },
-            "required": ["query"]
-        },
-        function=executor.execute_web_search,
-    )
-    print("  ✅ 注册 web_search 工具")
-
-    # 注册 web crawler 工具
-    client.register_tool(
-        name="web_crawl",
-        description="抓取网页内容并提取文本。用于获取特定网页的详细信息。",
-        parameters={
-            "type": "object",
-            "properties": {
-                "url": {
-                    "type": "string",
-                    "description": "要抓取的网页URL"
-                },
-                "extract_text": {
-                    "type": "boolean",
-                    "description": "是否提取纯文本内容",
-                    "default": True
-                }
-            },
-            "required": ["url"]
-        },
-        function=executor.execute_web_crawl,
-    )
-    print("  ✅ 注册 web_crawl 工具")
-
-    # 注册 code runner 工具
-    client.register_tool(
-        name="code_runner",
-        description="代码执行器，支持运行 python 和 javascript 代码",
-        parameters={
-            "type": "object",
-            "properties": {
-                "language": {
-                    "type": "string",
-                    "enum": ["python", "javascript"],
-                    "description": "编程语言"
-                },
-                "code": {
-                    "type": "string",
-                    "description": "要执行的代码"
-                }
-            },
-            "required": ["language", "code"]
-        },
-        function=executor.execute_code_runner,
-    )
-    print("  ✅ 注册 code_runner 工具\n")
-
-    # 4. 使用工具进行对话
+    # 2. 使用工具进行对话
     print("💬 开始对话...\n")
     print("=" * 60)
     
@@ -130,5 +56,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    # 可选：使用 uvloop 降低事件循环开销
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
 
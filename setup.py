@@ -20,15 +20,12 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         "click>=8.0.0",
-        "pydantic>=2.0.0",
         "jinja2>=3.0.0",
         "httpx>=0.24.0",
         "requests>=2.28.0",
@@ -50,11 +47,22 @@ setup(
         "search": [
             "ddgs>=5.0.0",
         ],
+        # Optional speedups: orjson (JSON), h2 (HTTP/2), uvloop (examples),
+        # numpy (semantic cache lookup), selectolax/lxml (HTML parsing)
+        "performance": [
+            "orjson>=3.9.0",
+            "h2>=4.0.0",
+            'uvloop>=0.17.0; platform_system != "Windows"',
+            "numpy>=1.24.0",
+            "selectolax>=0.3.17",
+            "lxml>=4.9.0",
+        ],
         # All optional features
         "all": [
             "openai>=1.0.0",
             "anthropic>=0.28.0",
             "ddgs>=5.0.0",
+            "h2>=4.0.0",
         ],
         # Development dependencies
         "dev": [
@@ -1,15 +1,23 @@
 """Actions module for coding agent."""
 
-from .base import BaseAction
+from .base import ActionProtocol, BaseAction
 from .analyze import AnalyzeRequirementAction
 from .generate import GenerateCodeAction
 from .plan import CreateTodoAction
-from .search import WebSearchAction
 
 __all__ = [
+    "ActionProtocol",
     "BaseAction",
     "AnalyzeRequirementAction",
     "GenerateCodeAction",
     "CreateTodoAction",
     "WebSearchAction",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    # WebSearchAction pulls in httpx and BeautifulSoup; import it on demand
+    if name == "WebSearchAction":
+        from .search import WebSearchAction
+        return WebSearchAction
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
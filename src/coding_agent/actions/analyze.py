@@ -5,6 +5,16 @@ import click
 from .base import BaseAction
 from ..core.state import AgentState
 
+_FALLBACK_TEMPLATE = """Basic analysis of request: "{req}"
+
+The user wants code to be generated based on their requirements. This requires:
+1. Understanding the specific coding task
+2. Creating a plan with actionable steps
+3. Generating clean, functional code
+4. Ensuring the code meets user expectations
+
+Next step: Create a detailed todo list with specific tasks to accomplish this goal."""
+
 
 class AnalyzeRequirementAction(BaseAction):
     """Analyzes the user's coding requirement."""
@@ -29,6 +39,7 @@ class AnalyzeRequirementAction(BaseAction):
 
         # If LLM client is available, use it for better analysis
         if self.llm_client:
+            # Responses are cached by the client
             try:
                 analysis = await self.llm_client.analyze_requirement(user_request)
                 return {"analysis": analysis}
@@ -37,14 +48,6 @@ class AnalyzeRequirementAction(BaseAction):
                 click.echo(f"Warning: LLM analysis failed: {str(e)}", err=True)
 
         # Fallback analysis without LLM
-        analysis = f"""Basic analysis of request: "{user_request}"
-
-The user wants code to be generated based on their requirements. This requires:
-1. Understanding the specific coding task
-2. Creating a plan with actionable steps
-3. Generating clean, functional code
-4. Ensuring the code meets user expectations
-
-Next step: Create a detailed todo list with specific tasks to accomplish this goal."""
+        analysis = _FALLBACK_TEMPLATE.format(req=user_request)
 
         return {"analysis": analysis}
\ No newline at end of file
@@ -1,13 +1,30 @@
 """Base action class for agentic actions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Protocol, Tuple
 from ..core.state import AgentState
 
 
+class ActionProtocol(Protocol):
+    """Structural type for anything the loop can execute as an action."""
+
+    name: str
+    description: str
+
+    async def execute(self, state: AgentState, **kwargs) -> Dict[str, Any]:
+        ...
+
+    def can_execute(self, state: AgentState) -> bool:
+        ...
+
+
 class BaseAction(ABC):
     """Base class for all agent actions."""
     
+    # Names of actions whose results this action reads; actions with no
+    # dependency on each other may be executed concurrently by the loop
+    depends_on: Tuple[str, ...] = ()
+    
     def __init__(self, name: str, description: str):
         self.name = name
         self.description = description
@@ -34,4 +51,7 @@ class BaseAction(ABC):
         Returns:
             True if action can execute, False otherwise
         """
-        return True
\ No newline at end of file
+        return True
+    
+    async def aclose(self) -> None:
+        """Release resources (such as HTTP connections) held by the action."""
\ No newline at end of file
@@ -8,6 +8,8 @@ from ..core.state import AgentState
 class GenerateCodeAction(BaseAction):
     """Generates code based on analysis and todo list."""
     
+    depends_on = ("analyze_requirement", "create_todo")
+    
     def __init__(self, llm_client=None):
         super().__init__(
             name="generate_code",
@@ -1,14 +1,32 @@
 """Todo list creation action."""
 
-import uuid
+import itertools
 from typing import Any, Dict, List
 from .base import BaseAction
-from ..core.state import AgentState, Task, TaskStatus
+from ..core.state import AgentState, Task
+
+_id_counter = itertools.count()
+
+# (content, priority) pairs for the placeholder LLM todo list
+_DEFAULT_TODOS = (
+    ("Understand the core requirements and constraints", "high"),
+    ("Design the code structure and architecture", "high"),
+    ("Implement the main functionality", "high"),
+    ("Add error handling and edge cases", "medium"),
+    ("Write documentation and examples", "low"),
+)
+
+
+def _short_id() -> str:
+    """Return a short, process-unique task id."""
+    return f"t{next(_id_counter):08x}"
 
 
 class CreateTodoAction(BaseAction):
     """Creates a todo list based on analysis."""
     
+    depends_on = ("analyze_requirement",)
+    
     def __init__(self, llm_client=None):
         super().__init__(
             name="create_todo",
@@ -28,7 +46,7 @@ class CreateTodoAction(BaseAction):
         analysis = state.analysis
         user_request = state.user_request
         
-        todo_list: List[Dict[str, Any]] = []
+        todo_list: List[Task] = []
         
         if self.llm_client:
             try:
@@ -47,36 +65,8 @@ Format as a list of tasks with id, content, and priority."""
                 
                 # Placeholder - in real implementation would call LLM
                 todo_list = [
-                    {
-                        "id": str(uuid.uuid4())[:8],
-                        "content": "Understand the core requirements and constraints",
-                        "status": TaskStatus.PENDING,
-                        "priority": "high"
-                    },
-                    {
-                        "id": str(uuid.uuid4())[:8],
-                        "content": "Design the code structure and architecture",
-                        "status": TaskStatus.PENDING,
-                        "priority": "high"
-                    },
-                    {
-                        "id": str(uuid.uuid4())[:8],
-                        "content": "Implement the main functionality",
-                        "status": TaskStatus.PENDING,
-                        "priority": "high"
-                    },
-                    {
-                        "id": str(uuid.uuid4())[:8],
-                        "content": "Add error handling and edge cases",
-                        "status": TaskStatus.PENDING,
-                        "priority": "medium"
-                    },
-                    {
-                        "id": str(uuid.uuid4())[:8],
-                        "content": "Write documentation and examples",
-                        "status": TaskStatus.PENDING,
-                        "priority": "low"
-                    }
+                    Task(id=_short_id(), content=content, priority=priority)
+                    for content, priority in _DEFAULT_TODOS
                 ]
                 
                 return {"todo_list": todo_list}
@@ -85,24 +75,21 @@ Format as a list of tasks with id, content, and priority."""
         
         # Fallback todo list without LLM
         todo_list = [
-            {
-                "id": "task-001",
-                "content": "Analyze and understand the requirements",
-                "status": TaskStatus.PENDING,
-                "priority": "high"
-            },
-            {
-                "id": "task-002",
-                "content": f"Create implementation for: {user_request[:50]}...",
-                "status": TaskStatus.PENDING,
-                "priority": "high"
-            },
-            {
-                "id": "task-003",
-                "content": "Test and validate the generated code",
-                "status": TaskStatus.PENDING,
-                "priority": "medium"
-            }
+            Task(
+                id="task-001",
+                content="Analyze and understand the requirements",
+                priority="high",
+            ),
+            Task(
+                id="task-002",
+                content=f"Create implementation for: {user_request[:50]}...",
+                priority="high",
+            ),
+            Task(
+                id="task-003",
+                content="Test and validate the generated code",
+                priority="medium",
+            ),
         ]
         
         return {"todo_list": todo_list}
\ No newline at end of file
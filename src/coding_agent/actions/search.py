@@ -1,27 +1,67 @@
 """Web search and crawl action."""
 
-from typing import Any, Dict, List
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 import click
 from .base import BaseAction
 from ..core.state import AgentState
+from ..tools.llm_cache import InMemoryLRUBackend
 from ..tools.web_search import WebSearch, SearchResult
-from ..tools.web_crawler import WebCrawler
+from ..tools.web_crawler import WebCrawler, WebPage
+
+# (keyword, query template) pairs in priority order; a pending task uses the
+# template of the first keyword it contains
+_TASK_QUERY_TEMPLATES = (
+    ("function", "python {task} example implementation"),
+    ("class", "python {task} example implementation"),
+    ("api", "how to create {task}"),
+    ("database", "python database {task} tutorial"),
+)
 
 
 class WebSearchAction(BaseAction):
     """Performs web searches and optionally crawls the results to gather information."""
 
-    def __init__(self, enable_crawling: bool = True, max_crawl_urls: int = 3):
+    # Maximum number of entries kept in search/crawl history
+    HISTORY_LIMIT = 100
+
+    # Seconds a cached search result stays fresh
+    QUERY_CACHE_TTL = 900
+
+    # Search results shared across instances, keyed by normalized query;
+    # least recently used entries are evicted past 256
+    _query_cache = InMemoryLRUBackend(max_size=256)
+
+    # Search tool shared across instances, created on first use
+    _shared_search_tool: Optional[WebSearch] = None
+
+    def __init__(
+        self,
+        enable_crawling: bool = True,
+        max_crawl_urls: int = 3,
+        max_concurrent_searches: int = 3,
+    ):
         super().__init__(
             name="web_search",
             description="Search the web and crawl results for information to help with coding tasks"
         )
-        self.search_tool = None
+        self.search_tool: Optional[WebSearch] = None
         self.crawler_tool = None
-        self.search_history: List[Dict[str, Any]] = []
-        self.crawl_history: List[Dict[str, Any]] = []
+        self.search_history: Deque[Dict[str, Any]] = deque(maxlen=self.HISTORY_LIMIT)
+        self.crawl_history: Deque[Dict[str, Any]] = deque(maxlen=self.HISTORY_LIMIT)
         self.enable_crawling = enable_crawling
         self.max_crawl_urls = max_crawl_urls
+        # Bound in-flight DDGS requests so bursts don't get throttled
+        self._search_semaphore = asyncio.Semaphore(max_concurrent_searches)
+
+    def can_execute(self, state: AgentState) -> bool:
+        """Only run when the state yields at least one search query.
+
+        Checked before the search and crawler tools are initialized, so a
+        step with nothing to search does not pay for client setup.
+        """
+        return bool(self._generate_search_queries(state))
 
     async def execute(self, state: AgentState, **kwargs) -> Dict[str, Any]:
         """Execute web search and crawling based on the current state.
@@ -32,14 +72,18 @@ class WebSearchAction(BaseAction):
         Returns:
             Dictionary with search and crawl results
         """
-        # Initialize search tool if not already done
+        # Reuse the shared search tool, creating it on first use. Construction
+        # has no await point, so no lock is needed to keep it a singleton.
         if self.search_tool is None:
             try:
-                self.search_tool = WebSearch()
-                click.echo("✅ DDGS search tool initialized successfully")
+                if WebSearchAction._shared_search_tool is None:
+                    WebSearchAction._shared_search_tool = WebSearch()
+                    click.echo("✅ DDGS search tool initialized successfully")
+                self.search_tool = WebSearchAction._shared_search_tool
             except Exception as e:
                 click.echo(f"❌ Failed to initialize web search: {str(e)}", err=True)
                 return {
+                    "searched_step": state.current_step,
                     "search_performed": False,
                     "crawl_performed": False,
                     "search_results": [],
@@ -63,6 +107,7 @@ class WebSearchAction(BaseAction):
         if not queries:
             click.echo("ℹ️  No search queries generated")
             return {
+                "searched_step": state.current_step,
                 "search_performed": False,
                 "crawl_performed": False,
                 "search_results": [],
@@ -73,114 +118,164 @@ class WebSearchAction(BaseAction):
 
         # Perform searches
         all_results = []
-        all_urls_to_crawl = []
+        all_urls_to_crawl: List[str] = []
+        seen_urls = set()
         total_results_found = 0
         successful_queries = 0
         failed_queries = 0
 
-        for query in queries:
-            click.echo(f"\n🔍 Searching: '{query}'")
+        # Crawl workers start fetching as soon as the first search returns
+        # URLs, so the crawl overlaps with searches still in flight
+        crawling = bool(self.enable_crawling and self.crawler_tool)
+        # Entries are keyed by queue position so results keep URL order
+        url_queue: "asyncio.Queue[Optional[Tuple[int, str]]]" = asyncio.Queue()
+        crawl_entries: List[Tuple[int, Dict[str, Any]]] = []
+
+        async def crawl_worker() -> None:
+            while True:
+                item = await url_queue.get()
+                if item is None:
+                    return
+                index, url = item
+                try:
+                    entry = await self._fetch_entry(url)
+                except Exception as e:
+                    entry = WebPage(url=url, error=str(e)).to_dict()
+                crawl_entries.append((index, entry))
+
+        workers = []
+        if crawling:
+            workers = [
+                asyncio.create_task(crawl_worker()) for _ in range(self.max_crawl_urls)
+            ]
+
+        async def run_query(index: int, query: str) -> Tuple[int, Any]:
             try:
-                results = await self.search_tool.search(query, max_results=3)
-
-                # Filter out error results
-                valid_results = [r for r in results if r.source != "error"]
-                error_results = [r for r in results if r.source == "error"]
-
-                if error_results:
-                    click.echo(f"   ⚠️  Warning: {error_results[0].snippet}")
-
-                if valid_results:
-                    successful_queries += 1
-                    total_results_found += len(valid_results)
-                    click.echo(f"   ✅ Found {len(valid_results)} result(s)")
-
-                    # Collect URLs for crawling
-                    for result in valid_results[:2]:  # Top 2 results per query
-                        if WebCrawler.is_valid_url(result.url):
-                            all_urls_to_crawl.append(result.url)
-                            click.echo(f"   📄 Queued for crawl: {result.url[:60]}...")
-                        else:
-                            click.echo(f"   ⚠️  Invalid URL (skipping): {result.url[:60]}...")
-                else:
-                    click.echo(f"   ⚠️  No valid results returned")
-                    failed_queries += 1
-
-                search_entry = {
-                    "query": query,
-                    "results": [result.to_dict() for result in results]
-                }
-                all_results.append(search_entry)
-                self.search_history.append(search_entry)
-
+                return index, await self._cached_search(query)
             except Exception as e:
-                click.echo(f"   ❌ Search failed: {str(e)}", err=True)
+                return index, e
+
+        # Run all queries concurrently; DDGS calls are I/O bound. Progress
+        # lines are kept per query so they print in query order.
+        query_logs: List[List[str]] = [[] for _ in queries]
+        error_lines: List[str] = []
+        query_entries: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+
+        for next_done in asyncio.as_completed(
+            [run_query(index, query) for index, query in enumerate(queries)]
+        ):
+            index, results = await next_done
+            log = query_logs[index]
+            log.append(f"\n🔍 Searching: '{queries[index]}'")
+            if isinstance(results, Exception):
+                log.append(f"   ❌ Search failed")
+                error_lines.append(f"❌ Search failed for '{queries[index]}': {str(results)}")
                 failed_queries += 1
                 continue
 
-        # Print search summary
-        click.echo(f"\n{'='*60}")
-        click.echo(f"📋 DDGS SEARCH SUMMARY")
-        click.echo(f"{'='*60}")
-        click.echo(f"Total queries executed: {len(queries)}")
-        click.echo(f"Successful queries: {successful_queries}")
-        click.echo(f"Failed queries: {failed_queries}")
-        click.echo(f"Total results found: {total_results_found}")
-        click.echo(f"URLs queued for crawling: {len(all_urls_to_crawl)}")
-        click.echo(f"Search source: DDGS (ddgs package)")
-        click.echo(f"{'='*60}\n")
-
-        # Crawl the URLs if enabled
-        crawl_results = []
-        crawl_summary = None
+            # Partition results and build their dicts in a single pass
+            valid_results: List[SearchResult] = []
+            error_results: List[SearchResult] = []
+            result_dicts: List[Dict[str, Any]] = []
+            for r in results:
+                result_dicts.append(r.to_dict())
+                (error_results if r.source == "error" else valid_results).append(r)
+
+            if error_results:
+                log.append(f"   ⚠️  Warning: {error_results[0].snippet}")
+
+            if valid_results:
+                successful_queries += 1
+                total_results_found += len(valid_results)
+                log.append(f"   ✅ Found {len(valid_results)} result(s)")
+
+                # Queue URLs for crawling
+                for result in valid_results[:2]:  # Top 2 results per query
+                    if result.url in seen_urls:
+                        continue
+                    seen_urls.add(result.url)
+                    if not WebCrawler.is_valid_url(result.url):
+                        log.append(f"   ⚠️  Invalid URL (skipping): {result.url[:60]}...")
+                    elif len(all_urls_to_crawl) < self.max_crawl_urls:
+                        if crawling:
+                            url_queue.put_nowait((len(all_urls_to_crawl), result.url))
+                        all_urls_to_crawl.append(result.url)
+                        log.append(f"   📄 Queued for crawl: {result.url[:60]}...")
+            else:
+                log.append(f"   ⚠️  No valid results returned")
+                failed_queries += 1
 
-        if self.enable_crawling and all_urls_to_crawl and self.crawler_tool:
-            # Deduplicate URLs while preserving order
-            seen = set()
-            unique_urls = []
-            for url in all_urls_to_crawl:
-                if url not in seen:
-                    seen.add(url)
-                    unique_urls.append(url)
+            query_entries[index] = {
+                "query": queries[index],
+                "results": result_dicts
+            }
 
-            # Limit number of URLs to crawl
-            urls_to_crawl = unique_urls[:self.max_crawl_urls]
+        for search_entry in query_entries:
+            if search_entry is not None:
+                all_results.append(search_entry)
+                self.search_history.append(search_entry)
 
-            click.echo(f"\n🕷️  Starting web crawl for {len(urls_to_crawl)} URL(s)...")
+        # Print search summary
+        log_lines = [line for log in query_logs for line in log]
+        log_lines.append(
+            f"\n{'='*60}\n"
+            f"📋 DDGS SEARCH SUMMARY\n"
+            f"{'='*60}\n"
+            f"Total queries executed: {len(queries)}\n"
+            f"Successful queries: {successful_queries}\n"
+            f"Failed queries: {failed_queries}\n"
+            f"Total results found: {total_results_found}\n"
+            f"URLs queued for crawling: {len(all_urls_to_crawl)}\n"
+            f"Search source: DDGS (ddgs package)\n"
+            f"{'='*60}\n"
+        )
+        click.echo("\n".join(log_lines))
+        if error_lines:
+            click.echo("\n".join(error_lines), err=True)
 
-            # Fetch pages concurrently
-            crawl_results_dict = await self.crawler_tool.fetch_multiple(
-                urls_to_crawl, max_concurrent=3
-            )
+        # Let the crawl workers drain the queue and stop
+        for _ in workers:
+            url_queue.put_nowait(None)
+        await asyncio.gather(*workers)
 
-            # Process results
-            for url, page in crawl_results_dict.items():
-                crawl_entry = page.to_dict()
+        crawl_results = []
+        crawl_summary = None
+
+        if crawling and all_urls_to_crawl:
+            # Process results and tally the summary in one pass
+            successful_crawls = 0
+            failed_crawls = 0
+            total_content_size = 0
+            crawl_entries.sort(key=lambda item: item[0])
+            for _, crawl_entry in crawl_entries:
                 crawl_results.append(crawl_entry)
                 self.crawl_history.append(crawl_entry)
-
-            # Crawl summary
-            successful_crawls = len([r for r in crawl_results if r["status_code"] == 200])
-            failed_crawls = len([r for r in crawl_results if r["error"]])
-            total_content_size = sum(r.get("content_length", 0) for r in crawl_results)
+                if crawl_entry["status_code"] == 200:
+                    successful_crawls += 1
+                if crawl_entry["error"]:
+                    failed_crawls += 1
+                total_content_size += crawl_entry["content_length"]
 
             crawl_summary = {
-                "total_urls": len(urls_to_crawl),
+                "total_urls": len(all_urls_to_crawl),
                 "successful_crawls": successful_crawls,
                 "failed_crawls": failed_crawls,
                 "total_content_size": total_content_size
             }
 
             # Print crawl summary
-            click.echo(f"\n{'='*60}")
-            click.echo(f"🕷️  WEB CRAWL SUMMARY")
-            click.echo(f"{'='*60}")
-            click.echo(f"Total URLs crawled: {len(urls_to_crawl)}")
-            click.echo(f"Successful crawls: {successful_crawls}")
-            click.echo(f"Failed crawls: {failed_crawls}")
-            click.echo(f"Total content size: {total_content_size} bytes")
-            click.echo(f"Crawler: {'httpx (async)' if self.crawler_tool.prefer_async else 'requests (sync)'}")
-            click.echo(f"{'='*60}\n")
+            crawler_name = 'httpx (async)' if self.crawler_tool.prefer_async else 'requests (sync)'
+            click.echo(
+                f"\n{'='*60}\n"
+                f"🕷️  WEB CRAWL SUMMARY\n"
+                f"{'='*60}\n"
+                f"Total URLs crawled: {len(all_urls_to_crawl)}\n"
+                f"Successful crawls: {successful_crawls}\n"
+                f"Failed crawls: {failed_crawls}\n"
+                f"Total content size: {total_content_size} bytes\n"
+                f"Crawler: {crawler_name}\n"
+                f"{'='*60}\n"
+            )
         elif not self.enable_crawling:
             click.echo("ℹ️  Web crawling is disabled")
         elif not all_urls_to_crawl:
@@ -189,12 +284,13 @@ class WebSearchAction(BaseAction):
             click.echo("ℹ️  Crawler not available")
 
         return {
+            "searched_step": state.current_step,
             "search_performed": len(all_results) > 0,
             "crawl_performed": len(crawl_results) > 0,
             "search_results": all_results,
             "crawl_results": crawl_results,
-            "search_history": self.search_history,
-            "crawl_history": self.crawl_history,
+            "search_history": list(self.search_history),
+            "crawl_history": list(self.crawl_history),
             "search_summary": {
                 "total_queries": len(queries),
                 "successful_queries": successful_queries,
@@ -204,6 +300,48 @@ class WebSearchAction(BaseAction):
             "crawl_summary": crawl_summary
         }
 
+    async def aclose(self) -> None:
+        """Close the crawler's pooled HTTP connections."""
+        if self.crawler_tool is not None:
+            await self.crawler_tool.aclose()
+
+    async def _cached_search(self, query: str) -> List[SearchResult]:
+        """Search for a query, serving fresh results from the shared cache.
+
+        Args:
+            query: Search query string
+
+        Returns:
+            List of search results
+        """
+        key = query.lower().strip()
+        cached = await self._query_cache.get(key)
+        if cached is not None:
+            return cached
+
+        async with self._search_semaphore:
+            results = await self.search_tool.search(query, max_results=3)
+
+        # Don't cache failures so the next run retries
+        if not any(r.source == "error" for r in results):
+            await self._query_cache.set(key, results, ttl=self.QUERY_CACHE_TTL)
+        return results
+
+    async def _fetch_entry(self, url: str) -> Dict[str, Any]:
+        """Crawl a URL and reduce the page to its dict form.
+
+        The raw HTML is not kept alive by the crawl results. Recently fetched
+        pages are revalidated by the crawler's own page cache.
+
+        Args:
+            url: URL to fetch
+
+        Returns:
+            Crawled page entry (see WebPage.to_dict)
+        """
+        page = await self.crawler_tool.fetch(url)
+        return page.to_dict()
+
     def _generate_search_queries(self, state: AgentState) -> List[str]:
         """Generate search queries based on the current state.
 
@@ -228,21 +366,16 @@ class WebSearchAction(BaseAction):
             pending_tasks = state.get_pending_tasks()
             for task in pending_tasks[:2]:  # Limit to top 2 tasks
                 task_content = task.content.lower()
-                if "function" in task_content or "class" in task_content:
-                    queries.append(f"python {task.content} example implementation")
-                elif "api" in task_content:
-                    queries.append(f"how to create {task.content}")
-                elif "database" in task_content:
-                    queries.append(f"python database {task.content} tutorial")
+                template = next(
+                    (t for keyword, t in _TASK_QUERY_TEMPLATES if keyword in task_content),
+                    None,
+                )
+                if template is not None:
+                    queries.append(template.format(task=task.content))
 
         # Search for specific error context if any
         if state.context.get("error"):
             queries.append(f"python {state.context['error']} solution")
 
-        # Remove duplicates and limit total queries
-        unique_queries = []
-        for query in queries:
-            if query not in unique_queries:
-                unique_queries.append(query)
-
-        return unique_queries[:3]  # Limit to 3 queries max
+        # Remove duplicates (preserving order) and limit to 3 queries max
+        return list(dict.fromkeys(queries))[:3]
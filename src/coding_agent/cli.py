@@ -2,11 +2,14 @@
 
 import asyncio
 import click
+import httpx
 from pathlib import Path
 from typing import Optional
 
 from .core.loop import AgenticLoop
 from .core.state import AgentState
+from .tools import HTTP2_AVAILABLE
+from .tools.llm_client import AnthropicClient, OpenAIClient
 
 
 @click.command()
@@ -88,15 +91,21 @@ async def _run_agent(
     anthropic_auth_token: Optional[str]
 ):
     """Run the agent asynchronously."""
+    # One connection pool for every LLM call made by the agent's actions
+    shared_http = httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=32),
+        timeout=httpx.Timeout(600.0, connect=5.0),
+    )
     try:
         # Initialize Anthropic/Kimi client if auth token provided
         llm_client = None
         if anthropic_auth_token or anthropic_base_url:
             try:
-                from .tools.llm_client import AnthropicClient
                 llm_client = AnthropicClient(
                     base_url=anthropic_base_url,
-                    auth_token=anthropic_auth_token
+                    auth_token=anthropic_auth_token,
+                    http_client=shared_http,
                 )
                 click.echo("✨ Using Anthropic/Kimi LLM client")
             except ImportError as e:
@@ -106,7 +115,6 @@ async def _run_agent(
         elif api_key:
             # Fall back to OpenAI
             try:
-                from .tools.llm_client import OpenAIClient
                 llm_client = OpenAIClient(api_key)
                 click.echo("✨ Using OpenAI client")
             except ImportError:
@@ -118,6 +126,10 @@ async def _run_agent(
             click.echo("🔍 Web search enabled - will search for examples and context")
         if verbose:
             click.echo("-" * 50)
+            if web_search:
+                # Show per-URL crawl progress
+                from .tools.web_crawler import enable_verbose_logging
+                enable_verbose_logging()
 
         loop = AgenticLoop(llm_client=llm_client, enable_web_search=web_search)
         final_state = await loop.run(request)
@@ -219,6 +231,8 @@ async def _run_agent(
     except Exception as e:
         click.echo(f"\n❌ Error: {str(e)}", err=True)
         raise click.ClickException(str(e))
+    finally:
+        await shared_http.aclose()
 
 
 if __name__ == "__main__":
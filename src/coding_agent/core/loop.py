@@ -1,9 +1,45 @@
 """Agentic Action Loop implementation."""
 
-from typing import Dict, List, Type
-from .state import AgentState, TaskStatus
+import asyncio
+from typing import Any, Callable, Dict, List, Tuple
+from .state import AgentState, Task, TaskStatus
 from ..actions.base import BaseAction
-from ..actions import AnalyzeRequirementAction, CreateTodoAction, GenerateCodeAction, WebSearchAction
+from ..actions import AnalyzeRequirementAction, CreateTodoAction, GenerateCodeAction
+
+
+class _NoopAction(BaseAction):
+    """Placeholder returned once the loop has nothing left to do."""
+
+    def __init__(self):
+        super().__init__(name="noop", description="Do nothing")
+
+    async def execute(self, state: AgentState, **kwargs) -> Dict[str, Any]:
+        return {}
+
+    def can_execute(self, state: AgentState) -> bool:
+        return False
+
+
+_NOOP_ACTION = _NoopAction()
+
+# (predicate, action name) pairs checked in order; the first registered
+# action whose predicate holds runs next. web_search is only registered
+# when enabled.
+_DISPATCH: Tuple[Tuple[Callable[[AgentState], bool], str], ...] = (
+    # Start with analysis if not done yet
+    (lambda s: not s.analysis and s.current_step == "start", "analyze_requirement"),
+    # Create todo list if not done yet
+    (lambda s: not s.todo_list and bool(s.analysis), "create_todo"),
+    # Search for implementation examples before generating code, once;
+    # searching doesn't advance current_step
+    (
+        lambda s: s.current_step == "planned" and s.context.get("searched_step") != "planned"
+        and not s.generated_code and bool(s.get_pending_tasks()),
+        "web_search",
+    ),
+    # Generate code for pending tasks
+    (lambda s: not s.generated_code and bool(s.get_pending_tasks()), "generate_code"),
+)
 
 
 class AgenticLoop:
@@ -21,6 +57,7 @@ class AgenticLoop:
         self.register_action(CreateTodoAction(self.llm_client))
         self.register_action(GenerateCodeAction(self.llm_client))
         if self.enable_web_search:
+            from ..actions.search import WebSearchAction
             self.register_action(WebSearchAction())
 
     def register_action(self, action: BaseAction) -> None:
@@ -29,32 +66,71 @@ class AgenticLoop:
 
     def _determine_next_action(self, state: AgentState) -> BaseAction:
         """Determine the next action based on current state."""
-        # Start with analysis if not done yet
-        if not state.analysis and state.current_step == "start":
-            # If web search is enabled, search first to gather context
-            if self.enable_web_search and not state.context.get("search_performed"):
-                return self.actions["web_search"]
-            return self.actions["analyze_requirement"]
-
-        # Create todo list if not done yet
-        if not state.todo_list and state.analysis:
-            return self.actions["create_todo"]
-
-        # Check for pending tasks
-        pending_tasks = state.get_pending_tasks()
-        if pending_tasks and not state.generated_code:
-            # Search for implementation examples if needed
-            if self.enable_web_search and state.current_step == "planned":
-                return self.actions["web_search"]
-            return self.actions["generate_code"]
-
-        # If all tasks are done or no tasks needed, mark complete
-        if not pending_tasks or state.generated_code:
-            state.mark_complete()
-            # Return a no-op action
-            return self.actions["analyze_requirement"]  # Will check is_complete before executing
-
-        return self.actions["analyze_requirement"]
+        for predicate, name in _DISPATCH:
+            action = self.actions.get(name)
+            if action is not None and predicate(state) and action.can_execute(state):
+                return action
+
+        # All tasks are done or no tasks needed
+        state.mark_complete()
+        return _NOOP_ACTION
+
+    def _determine_next_actions(self, state: AgentState) -> List[BaseAction]:
+        """Determine the actions to run next, batching independent ones.
+
+        At the start, the context web search and the requirement analysis both
+        read only the user request, so they are returned together unless one
+        declares a dependency on the other.
+        """
+        if (
+            self.enable_web_search
+            and not state.analysis
+            and state.current_step == "start"
+            and not state.context.get("search_performed")
+        ):
+            batch = [self.actions["web_search"], self.actions["analyze_requirement"]]
+            # Drop the search when there is nothing to search for
+            batch = [a for a in batch if a.can_execute(state)]
+            names = {action.name for action in batch}
+            independent = [a for a in batch if not names.intersection(a.depends_on)]
+            # If there is a dependency, search first to gather context
+            return independent if len(independent) == len(batch) else batch[:1]
+
+        return [self._determine_next_action(state)]
+
+    def _apply_result(self, state: AgentState, result: Dict[str, Any]) -> None:
+        """Update the state with an action result."""
+        if "analysis" in result:
+            state.analysis = result["analysis"]
+            state.current_step = "analyzed"
+
+        if "todo_list" in result:
+            for task_data in result["todo_list"]:
+                if isinstance(task_data, Task):
+                    task = task_data
+                else:
+                    task = Task(**task_data)
+                state.add_task(task)
+            state.current_step = "planned"
+
+        if "code" in result:
+            state.generated_code = result["code"]
+            state.current_step = "completed"
+            # Mark all tasks as completed
+            for task in state.todo_list:
+                state.update_task_status(task.id, TaskStatus.COMPLETED)
+
+        # Store search results in context
+        if "search_results" in result:
+            state.context["searched_step"] = result.get("searched_step")
+            state.context["search_results"] = result["search_results"]
+            state.context["crawl_results"] = result.get("crawl_results", [])
+            state.context["search_performed"] = result.get("search_performed", False)
+            state.context["crawl_performed"] = result.get("crawl_performed", False)
+            if result.get("search_summary"):
+                state.context["search_summary"] = result["search_summary"]
+            if result.get("crawl_summary"):
+                state.context["crawl_summary"] = result["crawl_summary"]
 
     async def run(self, user_request: str) -> AgentState:
         """Run the agentic loop for a user request.
@@ -68,54 +144,46 @@ class AgenticLoop:
         # Initialize state
         state = AgentState(user_request=user_request)
 
-        # Run loop until complete
-        while not state.is_complete:
-            # Determine next action
-            action = self._determine_next_action(state)
+        try:
+            # Run loop until complete
+            while not state.is_complete:
+                # Determine next action(s)
+                actions = self._determine_next_actions(state)
 
-            # Skip if action can't execute (fallback)
-            if not action.can_execute(state):
-                state.mark_complete()
-                break
+                # Skip if action can't execute (fallback)
+                if not all(action.can_execute(state) for action in actions):
+                    state.mark_complete()
+                    break
 
-            # Execute action
-            try:
-                result = await action.execute(state)
+                # Execute independent actions concurrently. Exceptions are
+                # collected so one failure doesn't discard the others' results.
+                results = await asyncio.gather(
+                    *(action.execute(state) for action in actions),
+                    return_exceptions=True,
+                )
 
                 # Update state with results
-                if "analysis" in result:
-                    state.analysis = result["analysis"]
-                    state.current_step = "analyzed"
-
-                if "todo_list" in result:
-                    for task_data in result["todo_list"]:
-                        from ..core.state import Task
-                        task = Task(**task_data)
-                        state.add_task(task)
-                    state.current_step = "planned"
-
-                if "code" in result:
-                    state.generated_code = result["code"]
-                    state.current_step = "completed"
-                    # Mark all tasks as completed
-                    for task in state.todo_list:
-                        state.update_task_status(task.id, TaskStatus.COMPLETED)
-
-                # Store search results in context
-                if "search_results" in result:
-                    state.context["search_results"] = result["search_results"]
-                    state.context["crawl_results"] = result.get("crawl_results", [])
-                    state.context["search_performed"] = result.get("search_performed", False)
-                    state.context["crawl_performed"] = result.get("crawl_performed", False)
-                    if result.get("search_summary"):
-                        state.context["search_summary"] = result["search_summary"]
-                    if result.get("crawl_summary"):
-                        state.context["crawl_summary"] = result["crawl_summary"]
-
-            except Exception as e:
-                # Handle errors gracefully
-                state.context["error"] = str(e)
-                state.mark_complete()
-                break
+                errors = []
+                for result in results:
+                    if isinstance(result, Exception):
+                        errors.append(result)
+                        continue
+                    if isinstance(result, BaseException):
+                        # Cancellation and interrupts still propagate
+                        raise result
+                    try:
+                        self._apply_result(state, result)
+                    except Exception as e:
+                        errors.append(e)
+
+                if errors:
+                    # Handle errors gracefully
+                    state.context["error"] = str(errors[0])
+                    state.mark_complete()
+                    break
+        finally:
+            # Release pooled connections; they are bound to this event loop
+            for action in self.actions.values():
+                await action.aclose()
 
         return state
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Agent state management."""
 
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
-from pydantic import BaseModel
 from enum import Enum
 
 
@@ -13,7 +13,8 @@ class TaskStatus(str, Enum):
     FAILED = "failed"
 
 
-class Task(BaseModel):
+@dataclass(slots=True)
+class Task:
     """Represents a task in the todo list."""
     id: str
     content: str
@@ -22,14 +23,15 @@ class Task(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
-class AgentState(BaseModel):
+@dataclass(slots=True)
+class AgentState:
     """Central state for the agent."""
     
     # Original user request
     user_request: str
     
     # Current todo list
-    todo_list: List[Task] = []
+    todo_list: List[Task] = field(default_factory=list)
     
     # Generated analysis
     analysis: Optional[str] = None
@@ -41,26 +43,37 @@ class AgentState(BaseModel):
     current_step: str = "start"
     
     # Additional context
-    context: Dict[str, Any] = {}
+    context: Dict[str, Any] = field(default_factory=dict)
     
     # Whether the agent has completed its work
     is_complete: bool = False
     
+    # Task lookup by id, maintained alongside todo_list
+    _task_index: Dict[str, Task] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        for task in self.todo_list:
+            self._task_index.setdefault(task.id, task)
+    
     def add_task(self, task: Task) -> None:
         """Add a task to the todo list."""
         self.todo_list.append(task)
+        self._task_index.setdefault(task.id, task)
     
     def update_task_status(self, task_id: str, status: TaskStatus) -> None:
         """Update the status of a task."""
-        for task in self.todo_list:
-            if task.id == task_id:
-                task.status = status
-                break
+        task = self._task_index.get(task_id)
+        if task is not None:
+            task.status = status
     
     def get_pending_tasks(self) -> List[Task]:
         """Get all pending tasks."""
+        # Scanned on each call so tasks whose status was set directly are
+        # never missed or duplicated
         return [task for task in self.todo_list if task.status == TaskStatus.PENDING]
     
     def mark_complete(self) -> None:
         """Mark the agent as complete."""
-        self.is_complete = True
\ No newline at end of file
+        self.is_complete = True
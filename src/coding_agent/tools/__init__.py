@@ -1,26 +1,49 @@
-"""Tools module for external integrations."""
-
-from .llm_client import OpenAIClient, AnthropicClient
-from .web_search import WebSearch, SearchResult
-from .web_crawler import WebCrawler, WebPage
-from .tool_definitions import (
-    get_web_search_tool_definition,
-    get_web_crawler_tool_definition,
-    get_code_runner_tool_definition,
-    get_all_tool_definitions,
-)
-from .tool_executor import ToolExecutor
-
-__all__ = [
-    "OpenAIClient",
-    "AnthropicClient",
-    "WebSearch",
-    "SearchResult",
-    "WebCrawler",
-    "WebPage",
-    "get_web_search_tool_definition",
-    "get_web_crawler_tool_definition",
-    "get_code_runner_tool_definition",
-    "get_all_tool_definitions",
-    "ToolExecutor",
-]
\ No newline at end of file
+"""Tools module for external integrations.
+
+Submodules are imported lazily on first attribute access (PEP 562), so
+importing the package does not pull in httpx, BeautifulSoup or the LLM SDKs
+until a tool that needs them is used.
+"""
+
+import importlib
+import importlib.util
+from typing import Any
+
+# Whether httpx can negotiate HTTP/2 (requires the h2 package). Checked
+# without importing h2; httpx loads it itself when HTTP/2 is used.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "OpenAIClient": ".llm_client",
+    "AnthropicClient": ".llm_client",
+    "LLMCache": ".llm_cache",
+    "CacheBackend": ".llm_cache",
+    "InMemoryLRUBackend": ".llm_cache",
+    "make_cache_key": ".llm_cache",
+    "WebSearch": ".web_search",
+    "SearchResult": ".web_search",
+    "WebCrawler": ".web_crawler",
+    "WebPage": ".web_crawler",
+    "CachedResolver": ".dns_cache",
+    "get_web_search_tool_definition": ".tool_definitions",
+    "get_web_crawler_tool_definition": ".tool_definitions",
+    "get_code_runner_tool_definition": ".tool_definitions",
+    "get_all_tool_definitions": ".tool_definitions",
+    "ToolExecutor": ".tool_executor",
+    "get_client_and_executor": ".factory",
+}
+
+__all__ = ["HTTP2_AVAILABLE", *_LAZY]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + __all__)
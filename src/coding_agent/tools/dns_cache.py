@@ -0,0 +1,129 @@
+"""In-process DNS cache for asyncio event loops."""
+
+import asyncio
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+AddrInfo = List[Tuple[Any, ...]]
+Lookup = Callable[..., Awaitable[AddrInfo]]
+
+
+class CachedResolver:
+    """Caches ``getaddrinfo`` results with a TTL and stale-while-revalidate.
+
+    asyncio does not cache name resolution, so every new connection pays a
+    DNS lookup. Once installed on an event loop, fresh entries are served
+    from memory; expired entries are still served immediately while a
+    background task refreshes them. Concurrent lookups of the same uncached
+    address share one getaddrinfo call.
+    """
+
+    def __init__(self, ttl: float = 300.0):
+        """Initialize the resolver.
+
+        Args:
+            ttl: Seconds an entry is considered fresh
+        """
+        self.ttl = ttl
+        self._cache: Dict[Tuple[Any, ...], Tuple[float, AddrInfo]] = {}
+        self._refreshing: Set["asyncio.Task[None]"] = set()
+        # Lookups in flight for uncached addresses
+        self._pending: Dict[Tuple[Any, ...], "asyncio.Task[AddrInfo]"] = {}
+        self._loops: "weakref.WeakSet[asyncio.AbstractEventLoop]" = weakref.WeakSet()
+
+    async def resolve(
+        self,
+        lookup: Lookup,
+        host: Any,
+        port: Any,
+        *,
+        family: int = 0,
+        type: int = 0,
+        proto: int = 0,
+        flags: int = 0,
+    ) -> AddrInfo:
+        """Resolve an address, consulting the cache first.
+
+        Args:
+            lookup: Underlying getaddrinfo coroutine function
+            host, port, family, type, proto, flags: getaddrinfo arguments
+
+        Returns:
+            getaddrinfo result list
+        """
+        key = (host, port, family, type, proto, flags)
+        kwargs = {"family": family, "type": type, "proto": proto, "flags": flags}
+        entry = self._cache.get(key)
+
+        if entry is None:
+            pending = self._pending.get(key)
+            if pending is None or pending.get_loop() is not asyncio.get_running_loop():
+                pending = asyncio.ensure_future(self._lookup(lookup, key, host, port, kwargs))
+                self._pending[key] = pending
+                pending.add_done_callback(lambda task: self._forget_pending(key, task))
+            # Shield so one cancelled connection attempt doesn't fail the others
+            return await asyncio.shield(pending)
+
+        stored_at, infos = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            # Serve stale and refresh in the background
+            self._cache[key] = (time.monotonic(), infos)
+            task = asyncio.ensure_future(self._refresh(lookup, key, host, port, kwargs))
+            self._refreshing.add(task)
+            task.add_done_callback(self._refreshing.discard)
+        return infos
+
+    async def _lookup(
+        self, lookup: Lookup, key: Tuple[Any, ...], host: Any, port: Any, kwargs: Dict[str, int]
+    ) -> AddrInfo:
+        infos = await lookup(host, port, **kwargs)
+        self._cache[key] = (time.monotonic(), infos)
+        return infos
+
+    def _forget_pending(self, key: Tuple[Any, ...], task: "asyncio.Task[AddrInfo]") -> None:
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        if not task.cancelled():
+            # Mark the error retrieved in case every waiter was cancelled
+            task.exception()
+
+    async def _refresh(
+        self, lookup: Lookup, key: Tuple[Any, ...], host: Any, port: Any, kwargs: Dict[str, int]
+    ) -> None:
+        try:
+            await self._lookup(lookup, key, host, port, kwargs)
+        except OSError:
+            # Keep serving the stale entry until a refresh succeeds
+            pass
+
+    def install(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Route ``loop.getaddrinfo`` through this cache.
+
+        Installing on a loop that already uses this resolver is a no-op.
+
+        Args:
+            loop: Event loop to patch (defaults to the running loop)
+        """
+        loop = loop or asyncio.get_running_loop()
+        if loop in self._loops:
+            return
+
+        original = loop.getaddrinfo
+
+        async def getaddrinfo(host: Any, port: Any, *, family: int = 0, type: int = 0,
+                              proto: int = 0, flags: int = 0) -> AddrInfo:
+            return await self.resolve(
+                original, host, port, family=family, type=type, proto=proto, flags=flags
+            )
+
+        loop.getaddrinfo = getaddrinfo  # type: ignore[method-assign]
+        self._loops.add(loop)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._cache.clear()
+
+
+# Process-wide resolver so cached entries survive across event loops
+default_resolver = CachedResolver()
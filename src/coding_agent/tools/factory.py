@@ -0,0 +1,53 @@
+"""Shared LLM client and tool executor construction."""
+
+import asyncio
+import weakref
+from typing import Tuple
+
+from .llm_client import AnthropicClient
+from .tool_definitions import get_all_tool_definitions
+from .tool_executor import ToolExecutor
+
+# One client/executor pair per event loop; the SDK's connection pool is bound
+# to the loop it was first used on. Entries go away with their loop.
+_PER_LOOP: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_client_and_executor() -> Tuple[AnthropicClient, ToolExecutor]:
+    """Get an AnthropicClient with the default tools registered.
+
+    Within one running event loop the client and executor are built once and
+    reused, so repeated callers share the underlying HTTP connection pool and
+    tool registry. Called outside an event loop, it returns fresh instances.
+
+    Returns:
+        Tuple of (client, executor)
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _build_client_and_executor()
+
+    pair = _PER_LOOP.get(loop)
+    if pair is None:
+        pair = _PER_LOOP[loop] = _build_client_and_executor()
+    return pair
+
+
+def _build_client_and_executor() -> Tuple[AnthropicClient, ToolExecutor]:
+    """Build a client and executor with the default tools registered."""
+    client = AnthropicClient()
+    executor = ToolExecutor()
+
+    functions = {
+        "web_search": executor.execute_web_search,
+        "web_crawl": executor.execute_web_crawl,
+        "code_runner": executor.execute_code_runner,
+    }
+    specs = []
+    for definition in get_all_tool_definitions():
+        spec = definition["function"]
+        specs.append({**spec, "function": functions[spec["name"]]})
+    client.register_tools(specs)
+
+    return client, executor
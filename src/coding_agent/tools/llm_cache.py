@@ -0,0 +1,208 @@
+"""Response cache for LLM calls."""
+
+import hashlib
+import json
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Protocol, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class CacheBackend(Protocol):
+    """Storage backend used by LLMCache."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if missing/expired."""
+        ...
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key, expiring after ttl seconds if given."""
+        ...
+
+
+class InMemoryLRUBackend:
+    """In-process LRU cache backend with optional per-entry TTL."""
+
+    def __init__(self, max_size: int = 256):
+        """Initialize the backend.
+
+        Args:
+            max_size: Maximum number of entries kept before evicting the oldest
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+def make_cache_key(
+    model: Optional[str],
+    prompt: str,
+    temperature: float = 0,
+    max_tokens: Optional[int] = None,
+) -> str:
+    """Build a stable cache key for an LLM request.
+
+    Args:
+        model: Model name (None if the client does not expose one)
+        prompt: Prompt or user request text
+        temperature: Sampling temperature
+        max_tokens: Generation limit, if it affects the response
+
+    Returns:
+        Hex sha256 digest identifying the request
+    """
+    request = {"model": model, "prompt": prompt, "temperature": temperature, "max_tokens": max_tokens}
+    if orjson is not None:
+        payload = orjson.dumps(request, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(request, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    """Cosine similarity between two vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class LLMCache:
+    """Exact-match LLM response cache with optional semantic lookup.
+
+    Exact hits are served by key from the backend. If an ``embed`` callable is
+    supplied, prompts that miss exactly are compared against previously cached
+    prompts and the closest entry is returned when its cosine similarity
+    exceeds ``similarity_threshold``. With numpy installed, the stored
+    embeddings are kept normalized in one float32 matrix so a lookup is a
+    single matrix-vector product.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+        similarity_threshold: float = 0.92,
+        max_semantic_entries: int = 256,
+    ):
+        """Initialize the cache.
+
+        Args:
+            backend: Storage backend (defaults to an in-memory LRU)
+            embed: Optional function mapping text to an embedding vector
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            max_semantic_entries: Maximum number of embeddings kept for lookup
+        """
+        self.backend: CacheBackend = backend or InMemoryLRUBackend()
+        self.embed = embed
+        self.similarity_threshold = similarity_threshold
+        self.max_semantic_entries = max_semantic_entries
+        self._keys: List[str] = []
+        self._vectors: List[Sequence[float]] = []
+        self._matrix: Optional[Any] = None
+
+    async def get(self, key: str, prompt: Optional[str] = None) -> Optional[Any]:
+        """Look up a cached response.
+
+        Args:
+            key: Exact cache key (see make_cache_key)
+            prompt: Original prompt, used for semantic lookup when enabled
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        value = await self.backend.get(key)
+        if value is not None or self.embed is None or prompt is None:
+            return value
+
+        best_key = self._nearest(self.embed(prompt))
+        if best_key is None:
+            return None
+        return await self.backend.get(best_key)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        prompt: Optional[str] = None,
+    ) -> None:
+        """Store a response.
+
+        Args:
+            key: Exact cache key (see make_cache_key)
+            value: Response to cache
+            ttl: Time to live in seconds (None means no expiry)
+            prompt: Original prompt, indexed for semantic lookup when enabled
+        """
+        await self.backend.set(key, value, ttl)
+
+        if self.embed is not None and prompt is not None:
+            self._index(key, self.embed(prompt))
+
+    def _nearest(self, query: Sequence[float]) -> Optional[str]:
+        """Return the key of the closest stored prompt above the threshold."""
+        if not self._keys:
+            return None
+
+        if np is not None:
+            q = np.asarray(query, dtype=np.float32)
+            norm = np.linalg.norm(q)
+            if not norm:
+                return None
+            sims = self._matrix @ (q / norm)
+            best = int(np.argmax(sims))
+            return self._keys[best] if sims[best] > self.similarity_threshold else None
+
+        best_key, best_score = None, self.similarity_threshold
+        for cached_key, vector in zip(self._keys, self._vectors):
+            score = _cosine(query, vector)
+            if score > best_score:
+                best_key, best_score = cached_key, score
+        return best_key
+
+    def _index(self, key: str, vector: Sequence[float]) -> None:
+        """Add an embedding for semantic lookup, evicting the oldest if full."""
+        self._keys.append(key)
+        if np is not None:
+            row = np.asarray(vector, dtype=np.float32)
+            norm = np.linalg.norm(row)
+            row = (row / norm if norm else row)[np.newaxis, :]
+            self._matrix = row if self._matrix is None else np.vstack((self._matrix, row))
+        else:
+            self._vectors.append(vector)
+
+        if len(self._keys) > self.max_semantic_entries:
+            del self._keys[0]
+            if np is not None:
+                self._matrix = self._matrix[1:]
+            else:
+                del self._vectors[0]
@@ -1,14 +1,94 @@
 """LLM client for integrating with language models."""
 
+import asyncio
 import os
 import json
-from typing import Optional, Dict, Any, List, Callable
+from typing import Optional, Dict, Any, List, Callable, AsyncIterator, Awaitable, Sequence
+
+from .llm_cache import InMemoryLRUBackend, LLMCache, make_cache_key
 
 try:
     from anthropic import AsyncAnthropic
 except ImportError:
     AsyncAnthropic = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result to JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj)
+
+
+# Static instructions sent as system prompts. They come before the variable
+# request text and carry a cache_control breakpoint, so the server can reuse
+# the processed prefix across calls.
+ANALYSIS_SYSTEM = """Analyze the coding request in the user message and provide a detailed breakdown.
+
+Please provide:
+1. What type of code needs to be created (function, class, script, etc.)
+2. Key requirements and constraints
+3. Input/output specifications
+4. Any edge cases to consider
+5. Technology stack or language specifics
+
+Provide a clear, concise analysis that will help in creating a todo list and generating code."""
+
+CODE_SYSTEM = """Generate code based on the requirements in the user message.
+
+Please generate clean, well-documented code that fulfills the requirements. Include:
+1. Clear function/class definitions
+2. Proper error handling
+3. Docstrings and comments
+4. Example usage if appropriate
+
+Return only the code without additional explanations."""
+
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+def _cached_system(text: str) -> List[Dict[str, Any]]:
+    """Build a system prompt block list marked for prompt caching."""
+    return [{"type": "text", "text": text, "cache_control": _EPHEMERAL}]
+
+
+# Built once; the SDK only reads them
+_ANALYSIS_SYSTEM_BLOCKS = _cached_system(ANALYSIS_SYSTEM)
+_CODE_SYSTEM_BLOCKS = _cached_system(CODE_SYSTEM)
+
+_ANALYSIS_PROMPT_TEMPLATE = 'Request: "{request}"'
+
+_CODE_PROMPT_TEMPLATE = """User Request: "{request}"
+
+Analysis:
+{analysis}
+
+Todo Items:
+{todos}"""
+
+
+def _as_async(function: Callable) -> Callable[..., Awaitable[Any]]:
+    """Wrap a sync tool function so every tool can be awaited the same way."""
+    if asyncio.iscoroutinefunction(function):
+        return function
+
+    async def adapter(**kwargs: Any) -> Any:
+        return function(**kwargs)
+
+    return adapter
+
+
+def _with_cache_breakpoint(tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Mark the last tool definition so all tool definitions are cached."""
+    if not tools:
+        return tools
+    return [*tools[:-1], {**tools[-1], "cache_control": _EPHEMERAL}]
+
 
 class AnthropicClient:
     """Anthropic/Kimi API client wrapper with tools use support."""
@@ -19,6 +99,10 @@ class AnthropicClient:
         auth_token: Optional[str] = None,
         model: Optional[str] = None,
         small_fast_model: Optional[str] = None,
+        http_client: Optional[Any] = None,
+        cache_enabled: bool = True,
+        cache_ttl: Optional[float] = 3600,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
     ):
         """Initialize Anthropic client from environment variables or explicit parameters.
 
@@ -27,6 +111,13 @@ class AnthropicClient:
             auth_token: Authentication token (or set ANTHROPIC_AUTH_TOKEN env var)
             model: Model name for general tasks (or set ANTHROPIC_MODEL env var)
             small_fast_model: Model name for quick tasks (or set ANTHROPIC_SMALL_FAST_MODEL env var)
+            http_client: Shared httpx.AsyncClient for API requests, so calls reuse
+                its connection pool. The caller is responsible for closing it.
+            cache_enabled: Serve repeated generate_text calls from an in-process cache
+            cache_ttl: Seconds a cached response stays valid (None means no expiry)
+            embed: Optional function mapping text to an embedding vector. When
+                given, analyze_requirement reuses the analysis of a previously
+                seen request that is semantically close to the new one.
         """
         if AsyncAnthropic is None:
             raise ImportError("anthropic package not installed. Run: pip install anthropic")
@@ -47,15 +138,38 @@ class AnthropicClient:
                 "ANTHROPIC_AUTH_TOKEN environment variable or auth_token parameter is required"
             )
 
+        self.http_client = http_client
         self.client = AsyncAnthropic(
-            base_url=self.base_url, api_key=self.auth_token, max_retries=2
+            base_url=self.base_url,
+            api_key=self.auth_token,
+            max_retries=2,
+            http_client=http_client,
         )
 
+        # Exact-match response cache for generate_text
+        self.cache: Optional[LLMCache] = (
+            LLMCache(backend=InMemoryLRUBackend(max_size=1024)) if cache_enabled else None
+        )
+        self.cache_ttl = cache_ttl
+        # Semantic cache keyed on the user request rather than the full prompt,
+        # which is mostly static template text
+        self.semantic_cache: Optional[LLMCache] = (
+            LLMCache(embed=embed) if cache_enabled and embed is not None else None
+        )
+        # generate_text requests currently in flight, keyed like the cache so
+        # concurrent identical requests share one API call
+        self._inflight: Dict[str, "asyncio.Future[str]"] = {}
+
         # Tool registry: maps tool name to callable function
         self.tool_registry: Dict[str, Callable] = {}
+        # Awaitable adapters for the registered tools, resolved once at registration
+        self._tool_runners: Dict[str, Callable[..., Awaitable[Any]]] = {}
 
-        # Tool definitions for API
+        # Tool definitions in the Anthropic tools format
         self.tool_definitions: List[Dict[str, Any]] = []
+        # The same definitions as sent to the API (with a cache breakpoint),
+        # rebuilt only when tools are registered
+        self._tool_defs_for_api: List[Dict[str, Any]] = []
 
     def register_tool(
         self,
@@ -73,14 +187,48 @@ class AnthropicClient:
             function: Callable function to execute when tool is called
         """
         self.tool_registry[name] = function
+        self._tool_runners[name] = _as_async(function)
         self.tool_definitions.append({
-            "type": "function",
-            "function": {
-                "name": name,
-                "description": description,
-                "parameters": parameters,
-            }
+            "name": name,
+            "description": description,
+            "input_schema": parameters,
         })
+        self._tool_defs_for_api = _with_cache_breakpoint(self.tool_definitions)
+
+    def register_tools(self, specs: List[Dict[str, Any]]) -> None:
+        """Register several tools at once.
+
+        All specs are validated before any is registered, so a bad spec
+        leaves the client unchanged.
+
+        Args:
+            specs: Dicts with 'name', 'description', 'parameters' and 'function'
+                keys, as accepted by register_tool
+
+        Raises:
+            ValueError: If a spec is missing a key or a name is duplicated
+        """
+        required = ("name", "description", "parameters", "function")
+        names = set()
+        for spec in specs:
+            missing = [key for key in required if key not in spec]
+            if missing:
+                raise ValueError(f"Tool spec missing keys: {', '.join(missing)}")
+            if spec["name"] in names:
+                raise ValueError(f"Tool '{spec['name']}' specified more than once")
+            names.add(spec["name"])
+
+        self.tool_registry.update((spec["name"], spec["function"]) for spec in specs)
+        self._tool_runners.update((spec["name"], _as_async(spec["function"])) for spec in specs)
+        self.tool_definitions.extend(
+            {
+                "name": spec["name"],
+                "description": spec["description"],
+                "input_schema": spec["parameters"],
+            }
+            for spec in specs
+        )
+        self._tool_defs_for_api = _with_cache_breakpoint(self.tool_definitions)
 
     async def _execute_tool(self, tool_name: str, tool_input: Dict[str, Any]) -> Any:
         """Execute a registered tool.
@@ -92,40 +240,128 @@ class AnthropicClient:
         Returns:
             Tool execution result
         """
-        if tool_name not in self.tool_registry:
+        runner = self._tool_runners.get(tool_name)
+        if runner is None:
             raise ValueError(f"Tool '{tool_name}' not registered")
 
-        tool_function = self.tool_registry[tool_name]
+        return await runner(**tool_input)
 
-        # Execute the tool (handle both sync and async functions)
-        import asyncio
-        if asyncio.iscoroutinefunction(tool_function):
-            result = await tool_function(**tool_input)
-        else:
-            result = tool_function(**tool_input)
+    async def _run_tool_calls(
+        self, content_blocks: List[Any], tool_calls_made: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Execute the tool_use blocks of a model response concurrently.
 
-        return result
+        Args:
+            content_blocks: Content blocks from the model response
+            tool_calls_made: List that successful calls are appended to
+
+        Returns:
+            List of tool_result blocks to send back to the model
+        """
+        calls = [
+            (block.name, block.input, block.id)
+            for block in content_blocks
+            if block.type == "tool_use"
+        ]
+
+        # Independent tool calls run concurrently; gather keeps their order
+        outcomes = await asyncio.gather(
+            *(self._execute_tool(name, tool_input) for name, tool_input, _ in calls),
+            return_exceptions=True,
+        )
+
+        tool_results = []
+        for (tool_name, tool_input, tool_use_id), outcome in zip(calls, outcomes):
+            if isinstance(outcome, BaseException) and not isinstance(outcome, Exception):
+                raise outcome
+
+            try:
+                if isinstance(outcome, Exception):
+                    raise outcome
+
+                # Format result for API
+                content = outcome if isinstance(outcome, str) else _dumps(outcome)
+                tool_calls_made.append({
+                    "name": tool_name,
+                    "input": tool_input,
+                    "result": outcome,
+                })
+                tool_results.append({
+                    "type": "tool_result",
+                    "tool_use_id": tool_use_id,
+                    "content": content,
+                })
+            except Exception as e:
+                tool_results.append({
+                    "type": "tool_result",
+                    "tool_use_id": tool_use_id,
+                    "content": f"Error executing tool: {str(e)}",
+                    "is_error": True,
+                })
+
+        return tool_results
 
     async def generate_text(
-        self, prompt: str, max_tokens: int = 4000, model: Optional[str] = None
+        self,
+        prompt: str,
+        max_tokens: int = 4000,
+        model: Optional[str] = None,
+        system: Optional[List[Dict[str, Any]]] = None,
     ) -> str:
         """Generate text using the LLM.
 
+        Identical requests (same model, max_tokens, system and prompt) are
+        answered from the response cache when it is enabled, and concurrent
+        identical requests share a single API call.
+
         Args:
             prompt: Input prompt
             max_tokens: Maximum tokens to generate
             model: Model to use (defaults to ANTHROPIC_MODEL)
+            system: Optional system prompt content blocks
 
         Returns:
             Generated text
         """
         model_to_use = model or self.model
-
-        message = await self.client.messages.create(
-            model=model_to_use, max_tokens=max_tokens, messages=[{"role": "user", "content": prompt}]
-        )
-
-        return message.content[0].text
+        cache_prompt = prompt if system is None else f"{_dumps(system)}\0{prompt}"
+        key = make_cache_key(model_to_use, cache_prompt, max_tokens=max_tokens)
+
+        if self.cache is not None:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            request: Dict[str, Any] = {
+                "model": model_to_use,
+                "max_tokens": max_tokens,
+                "messages": [{"role": "user", "content": prompt}],
+            }
+            if system is not None:
+                request["system"] = system
+            inflight = asyncio.ensure_future(self._request_text(key, request))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda f: self._forget_inflight(key, f))
+
+        # Shield so one caller being cancelled doesn't cancel the shared call
+        return await asyncio.shield(inflight)
+
+    async def _request_text(self, key: str, request: Dict[str, Any]) -> str:
+        """Make a messages request and cache the resulting text."""
+        message = await self.client.messages.create(**request)
+        text = message.content[0].text
+        if self.cache is not None:
+            await self.cache.set(key, text, ttl=self.cache_ttl)
+        return text
+
+    def _forget_inflight(self, key: str, future: "asyncio.Future[str]") -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # Mark the exception retrieved in case every waiter was cancelled
+            future.exception()
 
     async def generate_with_tools(
         self,
@@ -148,82 +384,42 @@ class AnthropicClient:
             Dictionary with 'content' (final text) and 'tool_calls' (list of tool calls made)
         """
         model_to_use = model or self.model
-        tools_to_use = tools if tools is not None else self.tool_definitions
+        tools_to_use = (
+            self._tool_defs_for_api if tools is None else _with_cache_breakpoint(tools)
+        )
 
-        conversation_messages = messages.copy()
+        conversation_messages = list(messages)
         tool_calls_made = []
 
+        # Create message with or without tools
+        request: Dict[str, Any] = {
+            "model": model_to_use,
+            "max_tokens": max_tokens,
+            "messages": conversation_messages,
+        }
+        create = self.client.messages.create
+
+        if not tools_to_use and max_iterations > 0:
+            # Without tools the model can't ask for a tool call, so one
+            # request is the whole exchange
+            return self._final_response(await create(**request), tool_calls_made)
+        request["tools"] = tools_to_use
+
         for iteration in range(max_iterations):
-            # Create message with or without tools
-            if tools_to_use:
-                response = await self.client.messages.create(
-                    model=model_to_use,
-                    max_tokens=max_tokens,
-                    messages=conversation_messages,
-                    tools=tools_to_use,
-                )
-            else:
-                response = await self.client.messages.create(
-                    model=model_to_use,
-                    max_tokens=max_tokens,
-                    messages=conversation_messages,
-                )
+            response = await create(**request)
 
             # Check if the model wants to use a tool
             if response.stop_reason == "tool_use":
-                # Process tool calls
-                tool_results = []
-
-                for content_block in response.content:
-                    if content_block.type == "tool_use":
-                        tool_name = content_block.name
-                        tool_input = content_block.input
-                        tool_use_id = content_block.id
-
-                        # Execute the tool
-                        try:
-                            tool_result = await self._execute_tool(tool_name, tool_input)
-                            tool_calls_made.append({
-                                "name": tool_name,
-                                "input": tool_input,
-                                "result": tool_result,
-                            })
-
-                            # Format result for API
-                            tool_results.append({
-                                "type": "tool_result",
-                                "tool_use_id": tool_use_id,
-                                "content": json.dumps(tool_result) if not isinstance(tool_result, str) else tool_result,
-                            })
-                        except Exception as e:
-                            tool_results.append({
-                                "type": "tool_result",
-                                "tool_use_id": tool_use_id,
-                                "content": f"Error executing tool: {str(e)}",
-                                "is_error": True,
-                            })
+                tool_results = await self._run_tool_calls(response.content, tool_calls_made)
 
                 # Add assistant's response and tool results to conversation
-                conversation_messages.append({
-                    "role": "assistant",
-                    "content": response.content,
-                })
-                conversation_messages.append({
-                    "role": "user",
-                    "content": tool_results,
-                })
+                conversation_messages.extend((
+                    {"role": "assistant", "content": response.content},
+                    {"role": "user", "content": tool_results},
+                ))
             else:
                 # No more tool calls, return final response
-                final_text = ""
-                for content_block in response.content:
-                    if hasattr(content_block, "text"):
-                        final_text += content_block.text
-
-                return {
-                    "content": final_text,
-                    "tool_calls": tool_calls_made,
-                    "stop_reason": response.stop_reason,
-                }
+                return self._final_response(response, tool_calls_made)
 
         # Max iterations reached
         return {
@@ -232,31 +428,108 @@ class AnthropicClient:
             "stop_reason": "max_iterations",
         }
 
-    async def analyze_requirement(self, request: str) -> str:
+    @staticmethod
+    def _final_response(response: Any, tool_calls_made: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the generate_with_tools result from the model's last response."""
+        return {
+            "content": "".join(
+                block.text for block in response.content if hasattr(block, "text")
+            ),
+            "tool_calls": tool_calls_made,
+            "stop_reason": response.stop_reason,
+        }
+
+    async def stream_with_tools(
+        self,
+        messages: List[Dict[str, str]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        max_tokens: int = 4000,
+        model: Optional[str] = None,
+        max_iterations: int = 5,
+        tool_calls_made: Optional[List[Dict[str, Any]]] = None,
+    ) -> AsyncIterator[str]:
+        """Stream text with tool use support.
+
+        Text deltas are yielded as soon as the API produces them. Tool calls
+        are executed between turns, as in generate_with_tools.
+
+        Args:
+            messages: List of message dictionaries with 'role' and 'content'
+            tools: List of tool definitions (uses registered tools if None)
+            max_tokens: Maximum tokens to generate
+            model: Model to use (defaults to ANTHROPIC_MODEL)
+            max_iterations: Maximum number of tool call iterations
+            tool_calls_made: Optional list that executed tool calls are appended to
+
+        Yields:
+            Text chunks of the model's response
+        """
+        model_to_use = model or self.model
+        tools_to_use = (
+            self._tool_defs_for_api if tools is None else _with_cache_breakpoint(tools)
+        )
+        if tool_calls_made is None:
+            tool_calls_made = []
+
+        conversation_messages = list(messages)
+
+        request: Dict[str, Any] = {
+            "model": model_to_use,
+            "max_tokens": max_tokens,
+            "messages": conversation_messages,
+        }
+        if tools_to_use:
+            request["tools"] = tools_to_use
+        stream_message = self.client.messages.stream
+
+        for iteration in range(max_iterations):
+            async with stream_message(**request) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                response = await stream.get_final_message()
+
+            if response.stop_reason != "tool_use":
+                return
+
+            tool_results = await self._run_tool_calls(response.content, tool_calls_made)
+            conversation_messages.extend((
+                {"role": "assistant", "content": response.content},
+                {"role": "user", "content": tool_results},
+            ))
+
+    def analyze_requirement(self, request: str) -> Awaitable[str]:
         """Analyze a coding requirement.
 
+        Without a semantic cache this returns the generate_text coroutine
+        directly instead of wrapping it in another one.
+
         Args:
             request: User's coding request
 
         Returns:
-            Analysis text
+            Awaitable resolving to the analysis text
         """
-        analysis_prompt = f"""Analyze the following coding request and provide a detailed breakdown:
+        analysis_prompt = _ANALYSIS_PROMPT_TEMPLATE.format(request=request)
+        system = _ANALYSIS_SYSTEM_BLOCKS
 
-Request: "{request}"
+        if self.semantic_cache is None:
+            return self.generate_text(analysis_prompt, max_tokens=2000, system=system)
+        return self._analyze_with_semantic_cache(request, analysis_prompt, system)
 
-Please provide:
-1. What type of code needs to be created (function, class, script, etc.)
-2. Key requirements and constraints
-3. Input/output specifications
-4. Any edge cases to consider
-5. Technology stack or language specifics
-
-Provide a clear, concise analysis that will help in creating a todo list and generating code."""
+    async def _analyze_with_semantic_cache(
+        self, request: str, analysis_prompt: str, system: List[Dict[str, Any]]
+    ) -> str:
+        """Serve analyze_requirement from the semantic cache when possible."""
+        key = make_cache_key(self.model, request, max_tokens=2000)
+        cached = await self.semantic_cache.get(key, prompt=request)
+        if cached is not None:
+            return cached
 
-        return await self.generate_text(analysis_prompt, max_tokens=2000)
+        analysis = await self.generate_text(analysis_prompt, max_tokens=2000, system=system)
+        await self.semantic_cache.set(key, analysis, ttl=self.cache_ttl, prompt=request)
+        return analysis
 
-    async def generate_code(self, request: str, analysis: str, todo_items: list) -> str:
+    def generate_code(self, request: str, analysis: str, todo_items: list) -> Awaitable[str]:
         """Generate code based on analysis.
 
         Args:
@@ -265,27 +538,15 @@ Provide a clear, concise analysis that will help in creating a todo list and gen
             todo_items: List of todo items to guide generation
 
         Returns:
-            Generated code
+            Awaitable resolving to the generated code
         """
-        code_prompt = f"""Generate code based on the following requirements:
-
-User Request: "{request}"
-
-Analysis:
-{analysis}
-
-Todo Items:
-{"\n".join([f"- {item.content}" for item in todo_items])}
-
-Please generate clean, well-documented code that fulfills the requirements. Include:
-1. Clear function/class definitions
-2. Proper error handling
-3. Docstrings and comments
-4. Example usage if appropriate
-
-Return only the code without additional explanations."""
+        code_prompt = _CODE_PROMPT_TEMPLATE.format(
+            request=request,
+            analysis=analysis,
+            todos="\n".join("- " + item.content for item in todo_items),
+        )
 
-        return await self.generate_text(code_prompt, max_tokens=4000)
+        return self.generate_text(code_prompt, max_tokens=4000, system=_CODE_SYSTEM_BLOCKS)
 
 
 class OpenAIClient:
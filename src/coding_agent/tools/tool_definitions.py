@@ -2,6 +2,87 @@
 
 from typing import Dict, Any, List
 
+# Parameter schemas, built once at import and shared by every definition
+_WEB_SEARCH_PARAMS = {
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "搜索查询字符串"
+        },
+        "max_results": {
+            "type": "integer",
+            "description": "返回的最大结果数量",
+            "default": 5
+        }
+    },
+    "required": ["query"]
+}
+
+_WEB_CRAWL_PARAMS = {
+    "type": "object",
+    "properties": {
+        "url": {
+            "type": "string",
+            "description": "要抓取的网页URL"
+        },
+        "extract_text": {
+            "type": "boolean",
+            "description": "是否提取纯文本内容",
+            "default": True
+        }
+    },
+    "required": ["url"]
+}
+
+_CODE_RUNNER_PARAMS = {
+    "type": "object",
+    "properties": {
+        "language": {
+            "type": "string",
+            "enum": ["python", "javascript"],
+            "description": "编程语言"
+        },
+        "code": {
+            "type": "string",
+            "description": "要执行的代码"
+        }
+    },
+    "required": ["language", "code"]
+}
+
+
+# Complete definitions, also built once. Callers share these objects and
+# must not mutate them.
+_WEB_SEARCH_TOOL_DEF = {
+    "type": "function",
+    "function": {
+        "name": "web_search",
+        "description": "搜索网络以查找相关信息。可以用于查找代码示例、文档、最佳实践等。",
+        "parameters": _WEB_SEARCH_PARAMS,
+    }
+}
+
+_WEB_CRAWLER_TOOL_DEF = {
+    "type": "function",
+    "function": {
+        "name": "web_crawl",
+        "description": "抓取网页内容并提取文本。用于获取特定网页的详细信息。",
+        "parameters": _WEB_CRAWL_PARAMS,
+    }
+}
+
+_CODE_RUNNER_TOOL_DEF = {
+    "type": "function",
+    "function": {
+        "name": "code_runner",
+        "description": "代码执行器，支持运行 python 和 javascript 代码",
+        "parameters": _CODE_RUNNER_PARAMS,
+    }
+}
+
+_ALL_TOOL_DEFS = (_WEB_SEARCH_TOOL_DEF, _WEB_CRAWLER_TOOL_DEF, _CODE_RUNNER_TOOL_DEF)
+
 
 def get_web_search_tool_definition() -> Dict[str, Any]:
     """Get web search tool definition.
@@ -9,28 +90,7 @@ def get_web_search_tool_definition() -> Dict[str, Any]:
     Returns:
         Tool definition dictionary
     """
-    return {
-        "type": "function",
-        "function": {
-            "name": "web_search",
-            "description": "搜索网络以查找相关信息。可以用于查找代码示例、文档、最佳实践等。",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "搜索查询字符串"
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "返回的最大结果数量",
-                        "default": 5
-                    }
-                },
-                "required": ["query"]
-            }
-        }
-    }
+    return _WEB_SEARCH_TOOL_DEF
 
 
 def get_web_crawler_tool_definition() -> Dict[str, Any]:
@@ -39,28 +99,7 @@ def get_web_crawler_tool_definition() -> Dict[str, Any]:
     Returns:
         Tool definition dictionary
     """
-    return {
-        "type": "function",
-        "function": {
-            "name": "web_crawl",
-            "description": "抓取网页内容并提取文本。用于获取特定网页的详细信息。",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "要抓取的网页URL"
-                    },
-                    "extract_text": {
-                        "type": "boolean",
-                        "description": "是否提取纯文本内容",
-                        "default": True
-                    }
-                },
-                "required": ["url"]
-            }
-        }
-    }
+    return _WEB_CRAWLER_TOOL_DEF
 
 
 def get_code_runner_tool_definition() -> Dict[str, Any]:
@@ -69,39 +108,13 @@ def get_code_runner_tool_definition() -> Dict[str, Any]:
     Returns:
         Tool definition dictionary
     """
-    return {
-        "type": "function",
-        "function": {
-            "name": "code_runner",
-            "description": "代码执行器，支持运行 python 和 javascript 代码",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "language": {
-                        "type": "string",
-                        "enum": ["python", "javascript"],
-                        "description": "编程语言"
-                    },
-                    "code": {
-                        "type": "string",
-                        "description": "要执行的代码"
-                    }
-                },
-                "required": ["language", "code"]
-            }
-        }
-    }
+    return _CODE_RUNNER_TOOL_DEF
 
 
 def get_all_tool_definitions() -> List[Dict[str, Any]]:
     """Get all available tool definitions.
     
     Returns:
-        List of tool definitions
+        List of tool definitions (a new list of the shared definitions)
     """
-    return [
-        get_web_search_tool_definition(),
-        get_web_crawler_tool_definition(),
-        get_code_runner_tool_definition(),
-    ]
-
+    return list(_ALL_TOOL_DEFS)
@@ -1,13 +1,78 @@
 """Tool executor for handling tool calls."""
 
-import subprocess
-import tempfile
-import os
-from typing import Dict, Any, Optional
+import asyncio
+from typing import Dict, Any, Optional, Tuple
 
 from .web_search import WebSearch
 from .web_crawler import WebCrawler
 
+# Search and crawl tools shared by every ToolExecutor, created on first use so
+# their HTTP connection pools are reused. Construction has no await point, so
+# no lock is needed to keep them singletons. The crawler rebuilds its pool
+# when used from a new event loop, and no single executor closes them.
+_WEB_SEARCH: Optional[WebSearch] = None
+_WEB_CRAWLER: Optional[WebCrawler] = None
+
+
+def _shared_web_search() -> WebSearch:
+    global _WEB_SEARCH
+    if _WEB_SEARCH is None:
+        _WEB_SEARCH = WebSearch()
+    return _WEB_SEARCH
+
+
+def _shared_web_crawler() -> WebCrawler:
+    global _WEB_CRAWLER
+    if _WEB_CRAWLER is None:
+        _WEB_CRAWLER = WebCrawler()
+    return _WEB_CRAWLER
+
+
+# Characters of page text returned by web_crawl
+CRAWL_TEXT_LIMIT = 5000
+
+# Seconds a code_runner snippet may run before it is killed
+CODE_RUNNER_TIMEOUT = 5
+
+_CODE_RUNNER_LANGUAGES = frozenset(("python", "javascript"))
+
+# Interpreters read the program from stdin when given "-"
+_PYTHON_COMMAND = ("python3", "-")
+_NODE_COMMAND = ("node", "-")
+
+
+async def _run_process(command: Tuple[str, ...], code: str, timeout: float) -> Dict[str, Any]:
+    """Run a fresh interpreter with the source piped to its stdin.
+
+    Returns:
+        Dictionary with stdout, stderr and returncode
+
+    Raises:
+        asyncio.TimeoutError: If the process does not finish in time
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            proc.communicate(code.encode("utf-8")), timeout=timeout
+        )
+    except BaseException:
+        # Timed out or cancelled: don't leave the child running
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+
+    return {
+        "stdout": stdout.decode("utf-8", errors="replace"),
+        "stderr": stderr.decode("utf-8", errors="replace"),
+        "returncode": proc.returncode,
+    }
+
 
 class ToolExecutor:
     """Executes tools called by the LLM."""
@@ -29,7 +94,7 @@ class ToolExecutor:
         """
         if self.web_search is None:
             try:
-                self.web_search = WebSearch()
+                self.web_search = _shared_web_search()
             except Exception as e:
                 return {"error": f"Failed to initialize web search: {str(e)}"}
 
@@ -38,16 +103,7 @@ class ToolExecutor:
             return {
                 "success": True,
                 "query": query,
-                "results": [
-                    {
-                        "title": r.title,
-                        "url": r.url,
-                        "snippet": r.snippet,
-                        "source": r.source,
-                    }
-                    for r in results
-                    if r.source != "error"
-                ],
+                "results": [r.to_dict() for r in results if r.source != "error"],
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -64,12 +120,14 @@ class ToolExecutor:
         """
         if self.web_crawler is None:
             try:
-                self.web_crawler = WebCrawler()
+                self.web_crawler = _shared_web_crawler()
             except Exception as e:
                 return {"error": f"Failed to initialize web crawler: {str(e)}"}
 
         try:
-            page = await self.web_crawler.fetch(url, extract_text)
+            page = await self.web_crawler.fetch(
+                url, extract_text, max_chars=CRAWL_TEXT_LIMIT
+            )
             
             if page.error:
                 return {
@@ -83,15 +141,18 @@ class ToolExecutor:
                 "success": True,
                 "url": page.url,
                 "title": page.title,
-                "text": page.text[:5000] if extract_text else "",  # Limit text length
+                "text": page.text if extract_text else "",
                 "status_code": page.status_code,
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
 
-    def execute_code_runner(self, language: str, code: str) -> Dict[str, Any]:
+    async def execute_code_runner(self, language: str, code: str) -> Dict[str, Any]:
         """Execute code in a sandboxed environment.
 
+        Each snippet runs in a fresh interpreter process with the source
+        piped to its stdin.
+
         Args:
             language: Programming language (python or javascript)
             code: Code to execute
@@ -99,48 +160,16 @@ class ToolExecutor:
         Returns:
             Execution result dictionary
         """
-        if language not in ["python", "javascript"]:
+        if language not in _CODE_RUNNER_LANGUAGES:
             return {"success": False, "error": f"Unsupported language: {language}"}
 
         try:
-            # Create temporary file
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                suffix=".py" if language == "python" else ".js",
-                delete=False,
-            ) as f:
-                f.write(code)
-                temp_file = f.name
-
-            try:
-                # Execute code
-                if language == "python":
-                    result = subprocess.run(
-                        ["python3", temp_file],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-                else:  # javascript
-                    result = subprocess.run(
-                        ["node", temp_file],
-                        capture_output=True,
-                        text=True,
-                        timeout=5,
-                    )
-
-                return {
-                    "success": result.returncode == 0,
-                    "stdout": result.stdout,
-                    "stderr": result.stderr,
-                    "returncode": result.returncode,
-                }
-            finally:
-                # Clean up temp file
-                os.unlink(temp_file)
-
-        except subprocess.TimeoutExpired:
+            command = _PYTHON_COMMAND if language == "python" else _NODE_COMMAND
+            result = await _run_process(command, code, CODE_RUNNER_TIMEOUT)
+        except asyncio.TimeoutError:
             return {"success": False, "error": "Code execution timeout (5s limit)"}
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+        return {"success": result["returncode"] == 0, **result}
+
@@ -1,9 +1,18 @@
 """Web crawler tool for fetching and extracting content from web pages."""
 
 import asyncio
-import click
-from typing import Optional, Dict, Any, List
+import copy
+import importlib.util
+import logging
+import re
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Tuple
 import urllib.parse
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from . import HTTP2_AVAILABLE
+from .dns_cache import default_resolver
 
 try:
     import requests
@@ -14,27 +23,91 @@ except ImportError:
     BeautifulSoup = None
     httpx = None
 
+# BeautifulSoup fallback settings. With lxml (a C parser, which always adds
+# a body element) only the title and body subtrees are built; head scripts,
+# styles and metadata are skipped while tokenizing.
+if BeautifulSoup is not None and importlib.util.find_spec("lxml") is not None:
+    from bs4 import SoupStrainer
+    _BS_PARSER = "lxml"
+    _BS_PARSE_ONLY = SoupStrainer(["title", "body"])
+else:
+    # html.parser does not add a body to fragments, so it parses everything
+    _BS_PARSER = "html.parser"
+    _BS_PARSE_ONLY = None
+
+try:
+    # C (lexbor) HTML parser, much faster than BeautifulSoup's html.parser
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+logger = logging.getLogger(__name__)
+
+
+def enable_verbose_logging() -> None:
+    """Print the crawler's progress messages to stderr.
+
+    Progress is logged at INFO (per URL) and DEBUG (per-page details) level,
+    so it costs nothing when no handler is interested.
+    """
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG)
+
+
+# Elements whose text is not part of the page content
+_HIDDEN_TAGS = ["script", "style", "nav", "footer", "header"]
+
+# Whitespace normalization for extracted text: runs of spaces and tabs become
+# one space, and any whitespace containing a newline becomes one newline
+_SPACE_RE = re.compile(r"[^\S\n]+")
+_NEWLINE_RE = re.compile(r"\s*\n\s*")
+
+# is_valid_url: an http(s) scheme followed by a non-empty host
+_HTTP_URL_RE = re.compile(r"https?://[^/?#\s]", re.IGNORECASE)
+# extract_domain fast path: "scheme://netloc"; anything else goes to urlparse
+_NETLOC_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://([^/?#\s]*)(?:[/?#]|$)")
 
+# Content types whose body is decoded; other bodies (images, archives, PDFs)
+# are only measured
+_TEXT_CONTENT_TYPES = ("text/", "application/json", "application/xml", "application/xhtml+xml")
+
+# Responses that mean "try again later"
+_RETRY_STATUSES = frozenset((429, 503))
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds (HTTP dates are ignored)."""
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+class ParsedDoc(NamedTuple):
+    """Text and title extracted from one parse of an HTML document."""
+    text: Optional[str]
+    title: Optional[str]
+
+
+@dataclass(slots=True)
 class WebPage:
     """Represents a crawled web page."""
 
-    def __init__(
-        self,
-        url: str,
-        title: Optional[str] = None,
-        content: Optional[str] = None,
-        text: Optional[str] = None,
-        status_code: Optional[int] = None,
-        error: Optional[str] = None,
-        content_type: Optional[str] = None,
-    ):
-        self.url = url
-        self.title = title
-        self.content = content
-        self.text = text
-        self.status_code = status_code
-        self.error = error
-        self.content_type = content_type
+    url: str
+    title: Optional[str] = None
+    # Page bodies are left out of the repr
+    content: Optional[str] = field(default=None, repr=False)
+    text: Optional[str] = field(default=None, repr=False)
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    content_type: Optional[str] = None
+    content_length: Optional[int] = None
+    # Validators for conditional re-fetches
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -42,21 +115,71 @@ class WebPage:
             "url": self.url,
             "title": self.title,
             "text": self.text,
-            "content_length": len(self.content) if self.content else 0,
+            "content_length": (
+                self.content_length
+                if self.content_length is not None
+                else len(self.content) if self.content else 0
+            ),
             "status_code": self.status_code,
             "error": self.error,
             "content_type": self.content_type,
         }
 
 
+# Page cache key: (url, extract_text, max_chars)
+_PageKey = Tuple[str, bool, Optional[int]]
+
+
+class _BufferedResponse:
+    """HTTP response whose body was read up to the crawler's size limit."""
+
+    def __init__(self, response: Any, body: bytes, encoding: Optional[str], truncated: bool):
+        self.status_code = response.status_code
+        self.reason_phrase = getattr(response, "reason_phrase", None) or getattr(
+            response, "reason", ""
+        )
+        self.headers = response.headers
+        self.content = body
+        self.encoding = encoding or "utf-8"
+        self.truncated = truncated
+
+    @property
+    def text(self) -> str:
+        try:
+            return self.content.decode(self.encoding, errors="ignore")
+        except LookupError:
+            # Unknown charset in the Content-Type header
+            return self.content.decode("utf-8", errors="ignore")
+
+
 class WebCrawler:
     """Web crawler for fetching and extracting content from web pages."""
 
+    # Bytes read from the network per chunk when streaming a body
+    CHUNK_SIZE = 65536
+
+    # Seconds before the first retry; doubled on each further attempt
+    RETRY_BACKOFF = 0.5
+    # Longest wait between retries, including server-requested Retry-After
+    MAX_BACKOFF = 8.0
+
+    # Pages with an ETag or Last-Modified header are kept this many seconds
+    # and revalidated with a conditional GET when fetched again
+    PAGE_CACHE_TTL = 300
+    PAGE_CACHE_SIZE = 256
+
     def __init__(
         self,
         timeout: int = 10,
         user_agent: Optional[str] = None,
         prefer_async: bool = True,
+        client: Optional["httpx.AsyncClient"] = None,
+        max_bytes: Optional[int] = 5_000_000,
+        rps: Optional[float] = None,
+        per_host: Optional[int] = 6,
+        max_retries: int = 2,
+        verbose: bool = False,
+        dns_cache: bool = False,
     ):
         """Initialize web crawler.
 
@@ -64,6 +187,21 @@ class WebCrawler:
             timeout: Request timeout in seconds (default: 10)
             user_agent: User agent string (default: browser-like)
             prefer_async: Use httpx (async) if available, otherwise requests (sync)
+            client: Shared httpx.AsyncClient to fetch with. If omitted, the
+                crawler creates its own pooled client on first use and closes
+                it in aclose().
+            max_bytes: Stop reading a response body after this many bytes
+                (default: 5 MB; None means no limit)
+            rps: Maximum requests started per second across all fetches,
+                allowing bursts of up to rps requests (default: no limit)
+            per_host: Maximum concurrent fetch_multiple requests to one host
+                (default: 6; None means no limit)
+            max_retries: Retries after a 429/503 response or a connection
+                error (default: 2)
+            verbose: Print progress messages (see enable_verbose_logging)
+            dns_cache: Install the process-wide DNS cache on the event loop
+                the crawler's own client runs on. This patches that loop's
+                getaddrinfo, so it also affects other code on the loop.
         """
         if httpx is None and requests is None:
             raise ImportError(
@@ -76,191 +214,514 @@ class WebCrawler:
             "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         )
         self.prefer_async = prefer_async and httpx is not None
-
-        click.echo(f"✅ WebCrawler initialized (async: {self.prefer_async})")
-
-    async def fetch(self, url: str, extract_text: bool = True) -> WebPage:
+        self.max_bytes = max_bytes
+        self.rps = rps
+        # Token bucket for rps; starts full
+        self._tokens = max(1.0, rps) if rps else 0.0
+        self._last_refill = time.monotonic()
+        self.per_host = per_host
+        self.max_retries = max_retries
+        self.dns_cache = dns_cache
+        # Per-host semaphores for fetch_multiple, bound to the loop that made them
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._host_sems_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Cached pages with the time they were stored, oldest first
+        self._page_cache: "OrderedDict[_PageKey, Tuple[float, WebPage]]" = OrderedDict()
+        self._client = client
+        self._owns_client = client is None
+        # An owned client is bound to the loop it was created on
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        if verbose:
+            enable_verbose_logging()
+        logger.debug("✅ WebCrawler initialized (async: %s)", self.prefer_async)
+
+    async def fetch(
+        self, url: str, extract_text: bool = True, max_chars: Optional[int] = None
+    ) -> WebPage:
         """Fetch a web page.
 
         Args:
             url: URL to fetch
             extract_text: Extract plain text from HTML (default: True)
+            max_chars: Stop text extraction after this many characters
+                (default: no limit)
 
         Returns:
             WebPage object with fetched content
         """
-        click.echo(f"\n📥 Crawling: {url}")
+        logger.info("📥 Crawling: %s", url)
+
+        if self.rps:
+            await self._acquire()
 
         if self.prefer_async and httpx:
-            return await self._fetch_async(url, extract_text)
+            return await self._fetch_async(url, extract_text, max_chars)
         else:
-            # Run sync function in thread pool since requests is synchronous
-            loop = asyncio.get_event_loop()
-            return await loop.run_in_executor(None, self._fetch_sync, url, extract_text)
+            # Run sync function in a thread since requests is synchronous
+            return await asyncio.to_thread(self._fetch_sync, url, extract_text, max_chars)
 
     async def fetch_multiple(
-        self, urls: List[str], extract_text: bool = True, max_concurrent: int = 5
+        self, urls: List[str], extract_text: bool = True, max_concurrent: int = 20
     ) -> Dict[str, WebPage]:
         """Fetch multiple web pages concurrently.
 
+        The whole batch is returned at once; use fetch_multiple_iter to
+        process pages as they arrive. With HTTP/2 available, requests to the
+        same origin are multiplexed over one pooled connection, so a high
+        concurrency limit is cheap.
+
         Args:
             urls: List of URLs to fetch
             extract_text: Extract plain text from HTML (default: True)
-            max_concurrent: Maximum concurrent requests (default: 5)
+            max_concurrent: Maximum concurrent requests (default: 20)
 
         Returns:
-            Dictionary mapping URL to WebPage object
+            Dictionary mapping URL to WebPage object, in first-seen URL order
         """
-        click.echo(f"\n📊 Fetching {len(urls)} URL(s) concurrently (max {max_concurrent} at a time)")
+        # Each URL is a single key of the result, so fetch duplicates once
+        unique_urls = list(dict.fromkeys(urls))
+        pages = {}
+        async for url, page in self.fetch_multiple_iter(unique_urls, extract_text, max_concurrent):
+            pages[url] = page
+        return {url: pages[url] for url in unique_urls}
 
-        semaphore = asyncio.Semaphore(max_concurrent)
+    async def fetch_multiple_iter(
+        self, urls: List[str], extract_text: bool = True, max_concurrent: int = 20
+    ) -> AsyncIterator[Tuple[str, WebPage]]:
+        """Fetch multiple web pages concurrently, yielding each as it completes.
 
-        async def fetch_with_semaphore(url: str) -> WebPage:
-            async with semaphore:
-                return await self.fetch(url, extract_text)
+        Unlike fetch_multiple, pages can be processed (and released) while
+        slower fetches are still in flight.
 
-        tasks = [fetch_with_semaphore(url) for url in urls]
-        pages = await asyncio.gather(*tasks, return_exceptions=True)
-
-        result = {}
-        for url, page in zip(urls, pages):
-            if isinstance(page, Exception):
-                error_page = WebPage(url=url, error=str(page))
-                result[url] = error_page
-            else:
-                result[url] = page
+        Args:
+            urls: List of URLs to fetch
+            extract_text: Extract plain text from HTML (default: True)
+            max_concurrent: Maximum concurrent requests (default: 20)
 
-        return result
+        Yields:
+            (url, WebPage) tuples in completion order
+        """
+        logger.info(
+            "📊 Fetching %d URL(s) concurrently (max %d at a time)", len(urls), max_concurrent
+        )
 
-    async def _fetch_async(self, url: str, extract_text: bool = True) -> WebPage:
-        """Asynchronous fetch using httpx."""
+        # A fixed pool of workers pulls URLs in order, so a long URL list
+        # doesn't create one task per URL up front
+        pending: asyncio.Queue = asyncio.Queue()
+        for url in urls:
+            pending.put_nowait(url)
+        finished: asyncio.Queue = asyncio.Queue()
+
+        async def worker() -> None:
+            while not pending.empty():
+                url = pending.get_nowait()
+                try:
+                    if self.per_host is None:
+                        page = await self.fetch(url, extract_text)
+                    else:
+                        async with self._host_semaphore(url):
+                            page = await self.fetch(url, extract_text)
+                except Exception as e:
+                    page = WebPage(url=url, error=str(e))
+                except BaseException as e:
+                    # Hand the failure to the consumer rather than leave it
+                    # waiting for a result that will never come
+                    finished.put_nowait((url, e))
+                    raise
+                finished.put_nowait((url, page))
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(min(max_concurrent, len(urls)))]
         try:
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout),
+            for _ in urls:
+                url, page = await finished.get()
+                if isinstance(page, BaseException):
+                    raise page
+                yield url, page
+        finally:
+            # Don't leave fetches running if the consumer stops early
+            for task in workers:
+                task.cancel()
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Return the semaphore capping concurrent requests to url's host."""
+        loop = asyncio.get_running_loop()
+        if self._host_sems_loop is not loop:
+            self._host_sems = {}
+            self._host_sems_loop = loop
+        host = urllib.parse.urlsplit(url).netloc
+        semaphore = self._host_sems.get(host)
+        if semaphore is None:
+            semaphore = self._host_sems[host] = asyncio.Semaphore(self.per_host)
+        return semaphore
+
+    async def _acquire(self) -> None:
+        """Wait for a token from the rps bucket.
+
+        Tokens are reserved before sleeping (the count may go negative), so
+        concurrent callers queue up without a lock.
+        """
+        now = time.monotonic()
+        capacity = max(1.0, self.rps)
+        self._tokens = min(capacity, self._tokens + (now - self._last_refill) * self.rps)
+        self._last_refill = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rps)
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Return the pooled httpx client, creating it on first use.
+
+        An owned client's connections belong to the event loop that created
+        it, so a new client is made when the crawler is used from another loop.
+        """
+        if not self._owns_client:
+            return self._client
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not loop:
+            self._client = None
+            self._client_loop = loop
+        if self._client is None:
+            if self.dns_cache:
+                default_resolver.install(loop)
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0
+                ),
+                timeout=httpx.Timeout(self.timeout, connect=3.0),
                 follow_redirects=True,
-            ) as client:
-                headers = {"User-Agent": self.user_agent}
-                response = await client.get(url, headers=headers)
-
-                return self._process_response(response, url, extract_text)
+                headers={"User-Agent": self.user_agent},
+                http2=HTTP2_AVAILABLE,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled httpx client if this crawler created it."""
+        if self._owns_client and self._client is not None:
+            client, self._client = self._client, None
+            # A client from another (possibly closed) loop can't be closed here
+            if self._client_loop is asyncio.get_running_loop():
+                await client.aclose()
+
+    async def __aenter__(self) -> "WebCrawler":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _fetch_async(
+        self, url: str, extract_text: bool = True, max_chars: Optional[int] = None
+    ) -> WebPage:
+        """Asynchronous fetch using httpx.
+
+        Rate-limited (429/503) responses and transport errors are retried
+        with exponential backoff, up to max_retries times. Recently fetched
+        pages are revalidated, and reused if the server answers 304.
+        """
+        try:
+            cache_key = (url, extract_text, max_chars)
+            cached = self._cached_page(cache_key)
+            validators: Dict[str, str] = {}
+            if cached is not None:
+                if cached.etag:
+                    validators["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    validators["If-Modified-Since"] = cached.last_modified
+
+            attempt = 0
+            while True:
+                try:
+                    response = await self._get_once(url, validators)
+                except httpx.TransportError:
+                    if attempt >= self.max_retries:
+                        raise
+                    delay = None
+                else:
+                    if response.status_code not in _RETRY_STATUSES or attempt >= self.max_retries:
+                        break
+                    delay = _retry_after(response.headers.get("retry-after"))
+
+                if delay is None:
+                    delay = self.RETRY_BACKOFF * 2 ** attempt
+                await asyncio.sleep(min(self.MAX_BACKOFF, delay))
+                attempt += 1
+
+            if response.status_code == 304 and cached is not None:
+                logger.debug("✅ HTTP 304 - Not Modified (using cached page): %s", url)
+                self._cache_page(cache_key, cached)
+                return copy.copy(cached)
+
+            page = self._process_response(response, url, extract_text, max_chars)
+            if page.status_code == 200 and page.error is None:
+                page.etag = response.headers.get("etag")
+                page.last_modified = response.headers.get("last-modified")
+                if page.etag or page.last_modified:
+                    self._cache_page(cache_key, copy.copy(page))
+            return page
 
         except Exception as e:
-            click.echo(f"❌ Async fetch failed: {str(e)}")
+            logger.warning("❌ Async fetch failed: %s", e)
             return WebPage(url=url, error=str(e), status_code=0)
 
-    def _fetch_sync(self, url: str, extract_text: bool = True) -> WebPage:
+    async def _get_once(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> _BufferedResponse:
+        """Make one GET request, reading the body up to max_bytes."""
+        client = self._get_client()
+        if self._owns_client:
+            # User-Agent, timeout and redirects are the client's defaults
+            stream = client.stream("GET", url, headers=headers)
+        else:
+            stream = client.stream(
+                "GET",
+                url,
+                headers={"User-Agent": self.user_agent, **(headers or {})},
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
+
+        async with stream as response:
+            body = bytearray()
+            truncated = False
+            # Error pages are reported without reading their body
+            if response.status_code == 200:
+                async for chunk in response.aiter_bytes(self.CHUNK_SIZE):
+                    body += chunk
+                    if self.max_bytes is not None and len(body) > self.max_bytes:
+                        truncated = True
+                        break
+            return self._buffer(response, body, response.charset_encoding, truncated)
+
+    def _cached_page(self, key: _PageKey) -> Optional[WebPage]:
+        """Return an unexpired cached page, or None."""
+        entry = self._page_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, page = entry
+        if time.monotonic() - stored_at >= self.PAGE_CACHE_TTL:
+            del self._page_cache[key]
+            return None
+        return page
+
+    def _cache_page(self, key: _PageKey, page: WebPage) -> None:
+        """Store a page, evicting the oldest entries beyond PAGE_CACHE_SIZE."""
+        self._page_cache[key] = (time.monotonic(), page)
+        self._page_cache.move_to_end(key)
+        while len(self._page_cache) > self.PAGE_CACHE_SIZE:
+            self._page_cache.popitem(last=False)
+
+    def _fetch_sync(
+        self, url: str, extract_text: bool = True, max_chars: Optional[int] = None
+    ) -> WebPage:
         """Synchronous fetch using requests."""
         try:
             headers = {"User-Agent": self.user_agent}
-            response = requests.get(url, timeout=self.timeout, headers=headers, allow_redirects=True)
-
-            return self._process_response(response, url, extract_text)
+            with requests.get(
+                url, timeout=self.timeout, headers=headers, allow_redirects=True, stream=True
+            ) as response:
+                body = bytearray()
+                truncated = False
+                if response.status_code == 200:
+                    for chunk in response.iter_content(self.CHUNK_SIZE):
+                        body += chunk
+                        if self.max_bytes is not None and len(body) > self.max_bytes:
+                            truncated = True
+                            break
+                buffered = self._buffer(response, body, response.encoding, truncated)
+
+            return self._process_response(buffered, url, extract_text, max_chars)
 
         except Exception as e:
-            click.echo(f"❌ Sync fetch failed: {str(e)}")
+            logger.warning("❌ Sync fetch failed: %s", e)
             return WebPage(url=url, error=str(e), status_code=0)
 
-    def _process_response(self, response, url: str, extract_text: bool) -> WebPage:
+    def _buffer(
+        self, response: Any, body: bytearray, encoding: Optional[str], truncated: bool
+    ) -> _BufferedResponse:
+        """Wrap a streamed response and its body, cut to max_bytes."""
+        if truncated:
+            del body[self.max_bytes:]
+        return _BufferedResponse(response, bytes(body), encoding, truncated)
+
+    def _process_response(
+        self, response, url: str, extract_text: bool, max_chars: Optional[int] = None
+    ) -> WebPage:
         """Process HTTP response and extract content."""
         page = WebPage(url=url, status_code=response.status_code)
 
+        # Progress lines are only built when debug logging is on, and are
+        # logged once per page so output from concurrent fetches does not
+        # interleave
+        debug = logger.isEnabledFor(logging.DEBUG)
+        log: List[str] = []
+
         # Check if request was successful
         if response.status_code != 200:
             page.error = f"HTTP {response.status_code}: {response.reason_phrase if hasattr(response, 'reason_phrase') else ''}"
-            click.echo(f"❌ HTTP error: {page.error}")
+            logger.info("❌ HTTP error: %s", page.error)
             return page
 
-        click.echo(f"✅ HTTP {response.status_code} - OK")
+        if debug:
+            log.append(f"✅ HTTP {response.status_code} - OK")
 
         # Get content type
         content_type = response.headers.get("content-type", "").lower()
         page.content_type = content_type
 
+        if content_type and not self._is_text_content(content_type):
+            # Skip decoding binary bodies; report their size only
+            page.content_length = len(response.content)
+            if extract_text:
+                page.text = ""
+            if debug:
+                log.append(f"📦 Content length: {page.content_length} bytes (not decoded)")
+                logger.debug("%s", "\n".join(log))
+            return page
+
         # Get content
         if hasattr(response, "text"):
             page.content = response.text
         else:
             page.content = response.content.decode("utf-8", errors="ignore")
+        page.content_length = len(page.content)
 
-        click.echo(f"📦 Content length: {len(page.content)} bytes")
+        if debug:
+            log.append(f"📦 Content length: {page.content_length} bytes")
+            if getattr(response, "truncated", False):
+                log.append(f"✂️  Body truncated at {self.max_bytes} bytes")
 
-        # Extract text if HTML
-        if "text/html" in content_type and extract_text:
-            page.text = self._extract_text(page.content)
-            click.echo(f"📝 Extracted text: {len(page.text)} characters")
+        if "text/html" in content_type:
+            # Parse once for both the text and the title
+            parsed = self._parse_html(page.content, extract_text, max_chars)
+            page.title = parsed.title
 
-            if page.text:
-                # Show first few lines
-                lines = page.text.strip().split("\n")[:3]
-                for i, line in enumerate(lines, 1):
-                    if line.strip():
-                        click.echo(f"   Line {i}: {line.strip()[:80]}...")
+            if extract_text:
+                page.text = parsed.text
 
-        elif extract_text:
-            page.text = page.content
-            click.echo("📝 Using raw content as text")
+                if debug:
+                    log.append(f"📝 Extracted text: {len(page.text)} characters")
+                    # Show first few lines
+                    lines = page.text.strip().split("\n")[:3]
+                    for i, line in enumerate(lines, 1):
+                        if line.strip():
+                            log.append(f"   Line {i}: {line.strip()[:80]}...")
 
-        # Extract title if HTML
-        if "text/html" in content_type:
-            page.title = self._extract_title(page.content)
-            if page.title:
-                click.echo(f"📄 Page title: {page.title}")
+            if debug and page.title:
+                log.append(f"📄 Page title: {page.title}")
+
+        elif extract_text:
+            page.text = page.content if max_chars is None else page.content[:max_chars]
+            if debug:
+                log.append("📝 Using raw content as text")
 
+        if debug:
+            logger.debug("%s", "\n".join(log))
         return page
 
-    def _extract_text(self, html: str) -> str:
-        """Extract plain text from HTML."""
-        if BeautifulSoup is None:
-            return ""
+    def _extract_text(self, html: str, max_chars: Optional[int] = None) -> str:
+        """Extract plain text from HTML.
 
-        try:
-            soup = BeautifulSoup(html, "html.parser")
+        Args:
+            html: HTML source
+            max_chars: Stop once this many characters have been extracted
 
-            # Remove script and style elements
-            for element in soup(["script", "style", "nav", "footer", "header"]):
-                element.decompose()
+        Returns:
+            Text with whitespace collapsed and blank lines removed
+        """
+        return self._parse_html(html, max_chars=max_chars).text
 
-            # Get text
-            text = soup.get_text()
+    def _parse_html(
+        self, html: str, extract_text: bool = True, max_chars: Optional[int] = None
+    ) -> ParsedDoc:
+        """Parse HTML once and extract its plain text and title.
 
-            # Clean up text
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = "\n".join(chunk for chunk in chunks if chunk)
+        Args:
+            html: HTML source
+            extract_text: Extract the text as well as the title
+            max_chars: Stop text extraction once this many characters have
+                been extracted
 
-            return text
+        Returns:
+            ParsedDoc with the text (whitespace collapsed, blank lines
+            removed; None if not extracted) and the title (None if the page has none)
+        """
+        text = "" if extract_text else None
+        try:
+            if LexborHTMLParser is not None:
+                tree = LexborHTMLParser(html)
+                title_tag = tree.css_first("title")
+                title = title_tag.text().strip() if title_tag else None
+                if not extract_text:
+                    return ParsedDoc(text, title)
+                tree.strip_tags(_HIDDEN_TAGS)
+                strings: Iterable[str] = (
+                    node.text_content
+                    for node in tree.root.traverse(include_text=True)
+                    if node.tag == "-text"
+                )
+            elif BeautifulSoup is not None:
+                soup = BeautifulSoup(html, _BS_PARSER, parse_only=_BS_PARSE_ONLY)
+                title_tag = soup.find("title")
+                title = title_tag.get_text().strip() if title_tag else None
+                if not extract_text:
+                    return ParsedDoc(text, title)
+                # Remove script, style and page-chrome elements
+                for element in soup(_HIDDEN_TAGS):
+                    element.decompose()
+                strings = soup.strings
+            else:
+                return ParsedDoc(text, None)
+        except Exception as e:
+            logger.warning("⚠️  HTML parsing failed: %s", e)
+            return ParsedDoc(text, None)
+
+        try:
+            # Normalizing only shrinks text, so with a size limit read just
+            # enough strings to fill it instead of the whole page
+            parts: List[str] = []
+            raw_size = 0
+            needed = max_chars
+            for string in strings:
+                parts.append(string)
+                raw_size += len(string)
+                if needed is not None and raw_size >= needed:
+                    text = self._normalize_whitespace("".join(parts))
+                    if len(text) >= max_chars:
+                        break
+                    needed = raw_size + max_chars - len(text)
+            else:
+                text = self._normalize_whitespace("".join(parts))
+
+            if max_chars is not None:
+                text = text[:max_chars]
 
         except Exception as e:
-            click.echo(f"⚠️  Text extraction failed: {str(e)}")
-            return ""
+            logger.warning("⚠️  Text extraction failed: %s", e)
 
-    def _extract_title(self, html: str) -> Optional[str]:
-        """Extract title from HTML."""
-        if BeautifulSoup is None:
-            return None
+        return ParsedDoc(text, title)
 
-        try:
-            soup = BeautifulSoup(html, "html.parser")
-            title_tag = soup.find("title")
-            if title_tag:
-                return title_tag.get_text().strip()
-        except Exception:
-            pass
+    @staticmethod
+    def _normalize_whitespace(text: str) -> str:
+        """Collapse whitespace runs and drop blank lines."""
+        return _NEWLINE_RE.sub("\n", _SPACE_RE.sub(" ", text)).strip()
 
-        return None
+    @staticmethod
+    def _is_text_content(content_type: str) -> bool:
+        """Check whether a content type's body should be decoded as text."""
+        mime_type = content_type.split(";", 1)[0].strip()
+        return mime_type.startswith(_TEXT_CONTENT_TYPES) or mime_type.endswith(("+json", "+xml"))
 
     @staticmethod
     def is_valid_url(url: str) -> bool:
-        """Check if URL is valid."""
-        try:
-            result = urllib.parse.urlparse(url)
-            return all([result.scheme, result.netloc])
-        except Exception:
-            return False
+        """Check if URL is a crawlable http(s) URL with a host."""
+        return _HTTP_URL_RE.match(url) is not None
 
     @staticmethod
     def extract_domain(url: str) -> Optional[str]:
-        """Extract domain from URL."""
+        """Extract domain (network location) from URL."""
+        match = _NETLOC_RE.match(url)
+        if match is not None:
+            return match.group(1)
         try:
             return urllib.parse.urlparse(url).netloc
         except Exception:
@@ -1,6 +1,9 @@
 """Web search tools for querying information from the internet."""
 
 import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
 try:
@@ -9,14 +12,14 @@ except ImportError:
     DDGS = None
 
 
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     """Represents a search result."""
 
-    def __init__(self, title: str, url: str, snippet: str, source: str = "unknown"):
-        self.title = title
-        self.url = url
-        self.snippet = snippet
-        self.source = source
+    title: str
+    url: str
+    snippet: str
+    source: str = "unknown"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -31,12 +34,15 @@ class SearchResult:
 class WebSearch:
     """Web search interface supporting multiple search engines."""
 
-    def __init__(self, backend: str = "ddgs"):
+    def __init__(self, backend: str = "ddgs", max_concurrent_searches: int = 4):
         """Initialize web search.
 
         Args:
             backend: Search backend to use ("ddgs")
+            max_concurrent_searches: Default cap on concurrent searches in
+                search_multiple, to avoid rate limiting
         """
+        self.max_concurrent_searches = max_concurrent_searches
         if backend == "ddgs":
             if DDGS is None:
                 raise ImportError(
@@ -58,25 +64,113 @@ class WebSearch:
         """
         return await self.searcher.search(query, max_results)
 
-    async def search_multiple(self, queries: List[str], max_results: int = 3) -> Dict[str, List[SearchResult]]:
-        """Search for multiple queries.
+    async def search_multiple(
+        self, queries: List[str], max_results: int = 3, max_concurrent: Optional[int] = None
+    ) -> Dict[str, List[SearchResult]]:
+        """Search for multiple queries concurrently.
+
+        A query that fails gets a single error result instead of failing the
+        whole batch.
 
         Args:
             queries: List of search query strings
             max_results: Maximum number of results per query
+            max_concurrent: Maximum searches in flight at once (default:
+                max_concurrent_searches)
 
         Returns:
-            Dictionary mapping query to list of results
+            Dictionary mapping query to list of results, in query order
         """
-        results = {}
-        for query in queries:
-            results[query] = await self.search(query, max_results)
-        return results
+        semaphore = asyncio.Semaphore(max_concurrent or self.max_concurrent_searches)
+
+        async def search_with_semaphore(query: str) -> List[SearchResult]:
+            async with semaphore:
+                return await self.search(query, max_results)
+
+        results = await asyncio.gather(
+            *(search_with_semaphore(q) for q in queries), return_exceptions=True
+        )
+        search_results: Dict[str, List[SearchResult]] = {}
+        for query, result in zip(queries, results):
+            if isinstance(result, Exception):
+                result = [
+                    SearchResult(
+                        title="Search Error",
+                        url="",
+                        snippet=f"Failed to search: {str(result)}",
+                        source="error",
+                    )
+                ]
+            elif isinstance(result, BaseException):
+                # Cancellation and interrupts still propagate
+                raise result
+            search_results[query] = result
+        return search_results
 
 
 class DDGSSearch:
     """DDGS (formerly DuckDuckGo) search implementation."""
 
+    # Blocking DDGS calls allowed in flight at once, across all instances
+    MAX_WORKERS = 4
+
+    # Dedicated threads shared by every DDGSSearch, so blocking searches
+    # don't occupy the default executor used by other tools; created on
+    # first use
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        if DDGSSearch._executor is None:
+            DDGSSearch._executor = ThreadPoolExecutor(
+                max_workers=cls.MAX_WORKERS, thread_name_prefix="ddgs"
+            )
+        return DDGSSearch._executor
+
+    # One DDGS session per pool thread, reused across queries so its HTTP
+    # connection survives. Sessions are not shared between threads, so no
+    # lock is held around a search.
+    _local = threading.local()
+    _sessions: List[Any] = []
+    _sessions_lock = threading.Lock()
+    # Bumped by close() so threads drop their closed sessions
+    _generation = 0
+
+    @staticmethod
+    def _session() -> Any:
+        local = DDGSSearch._local
+        if getattr(local, "generation", None) != DDGSSearch._generation:
+            ddgs = DDGS()
+            with DDGSSearch._sessions_lock:
+                DDGSSearch._sessions.append(ddgs)
+            local.ddgs = ddgs
+            local.generation = DDGSSearch._generation
+        return local.ddgs
+
+    @staticmethod
+    def _discard_session() -> None:
+        """Close this thread's session, if it has a current one."""
+        local = DDGSSearch._local
+        if getattr(local, "generation", None) != DDGSSearch._generation:
+            return
+        local.generation = None
+        with DDGSSearch._sessions_lock:
+            try:
+                DDGSSearch._sessions.remove(local.ddgs)
+            except ValueError:
+                # Already closed by close()
+                return
+        local.ddgs.__exit__(None, None, None)
+
+    @staticmethod
+    def close() -> None:
+        """Close the DDGS sessions opened by every thread."""
+        with DDGSSearch._sessions_lock:
+            sessions, DDGSSearch._sessions = DDGSSearch._sessions, []
+            DDGSSearch._generation += 1
+        for ddgs in sessions:
+            ddgs.__exit__(None, None, None)
+
     async def search(self, query: str, max_results: int = 5) -> List[SearchResult]:
         """Search DDGS.
 
@@ -88,34 +182,32 @@ class DDGSSearch:
             List of search results
         """
         # Run sync function in thread pool since ddgs is synchronous
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self._sync_search, query, max_results)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), self._sync_search, query, max_results
+        )
 
     def _sync_search(self, query: str, max_results: int) -> List[SearchResult]:
         """Synchronous search implementation."""
-        results = []
         try:
-            with DDGS() as ddgs:
-                # Search for results
-                search_results = ddgs.text(query, max_results=max_results)
-
-                for result in search_results:
-                    search_result = SearchResult(
-                        title=result.get("title", ""),
-                        url=result.get("href", ""),
-                        snippet=result.get("body", ""),
-                        source="ddgs",
-                    )
-                    results.append(search_result)
+            return [
+                SearchResult(
+                    result.get("title", ""),
+                    result.get("href", ""),
+                    result.get("body", ""),
+                    "ddgs",
+                )
+                for result in self._session().text(query, max_results=max_results)
+            ]
         except Exception as e:
-            # Return empty list or error result on failure
-            results.append(
+            # Start the next search on this thread with a fresh session
+            self._discard_session()
+            # Return an error result on failure
+            return [
                 SearchResult(
                     title="Search Error",
                     url="",
                     snippet=f"Failed to search: {str(e)}",
                     source="error",
                 )
-            )
-
-        return results
+            ]
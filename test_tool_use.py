@@ -95,7 +95,7 @@ print(f"3214567 是素数: {is_prime(3214567)}")
 """
         
         print("🐍 执行 Python 代码...")
-        result = executor.execute_code_runner("python", python_code)
+        result = await executor.execute_code_runner("python", python_code)
         
         if result.get("success"):
             print(f"✅ 执行成功")
@@ -3,6 +3,7 @@
 这个脚本不依赖完整的项目安装，只测试核心的 tools use 逻辑。
 """
 
+import asyncio
 import sys
 import os
 
@@ -78,7 +79,7 @@ print(f"2 + 2 = {result}")
 """
         
         print("🐍 执行 Python 代码...")
-        result = executor.execute_code_runner("python", python_code)
+        result = asyncio.run(executor.execute_code_runner("python", python_code))
         
         if result.get("success"):
             print(f"✅ 执行成功")
@@ -102,7 +103,7 @@ print(f"{number} 是素数: {result}")
 """
         
         print("\n🔢 测试素数判断...")
-        result = executor.execute_code_runner("python", prime_code)
+        result = asyncio.run(executor.execute_code_runner("python", prime_code))
         
         if result.get("success"):
             print(f"✅ 执行成功")
@@ -0,0 +1,82 @@
+"""Tests for CachedResolver."""
+
+import asyncio
+
+from coding_agent.tools.dns_cache import CachedResolver
+
+
+def make_lookup(calls):
+    async def lookup(host, port, **kwargs):
+        calls.append(host)
+        return [("info", host, len(calls))]
+    return lookup
+
+
+def test_repeat_lookups_are_cached():
+    """Test that a fresh entry is served without a new lookup."""
+    calls = []
+    resolver = CachedResolver(ttl=60)
+    lookup = make_lookup(calls)
+
+    async def scenario():
+        first = await resolver.resolve(lookup, "example.com", 443)
+        second = await resolver.resolve(lookup, "example.com", 443)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == second
+    assert calls == ["example.com"]
+
+
+def test_stale_entry_served_while_refreshing():
+    """Test that an expired entry is returned and refreshed in the background."""
+    calls = []
+    resolver = CachedResolver(ttl=0)
+    lookup = make_lookup(calls)
+
+    async def scenario():
+        first = await resolver.resolve(lookup, "example.com", 443)
+        stale = await resolver.resolve(lookup, "example.com", 443)
+        await asyncio.sleep(0)
+        return first, stale
+
+    first, stale = asyncio.run(scenario())
+    assert stale == first
+    assert calls == ["example.com", "example.com"]
+
+
+def test_install_patches_running_loop():
+    """Test that install routes loop.getaddrinfo through the cache."""
+    resolver = CachedResolver(ttl=60)
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        calls = []
+        loop.getaddrinfo = make_lookup(calls)
+        resolver.install()
+        resolver.install()
+        await loop.getaddrinfo("localhost", 80)
+        await loop.getaddrinfo("localhost", 80)
+        return calls
+
+    assert asyncio.run(scenario()) == ["localhost"]
+
+
+def test_concurrent_cold_lookups_share_one_call():
+    """Test that simultaneous lookups of an uncached host resolve once."""
+    calls = []
+    resolver = CachedResolver(ttl=60)
+
+    async def slow_lookup(host, port, **kwargs):
+        calls.append(host)
+        await asyncio.sleep(0.01)
+        return [("info", host)]
+
+    async def scenario():
+        return await asyncio.gather(
+            *(resolver.resolve(slow_lookup, "example.com", 443) for _ in range(5))
+        )
+
+    results = asyncio.run(scenario())
+    assert results == [[("info", "example.com")]] * 5
+    assert calls == ["example.com"]
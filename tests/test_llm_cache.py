@@ -0,0 +1,101 @@
+"""Tests for LLMCache."""
+
+import asyncio
+
+from coding_agent.tools.llm_cache import InMemoryLRUBackend, LLMCache, make_cache_key
+
+
+def test_cache_key_is_stable():
+    """Test that identical requests produce identical keys."""
+    assert make_cache_key("m", "prompt") == make_cache_key("m", "prompt")
+    assert make_cache_key("m", "prompt") != make_cache_key("other", "prompt")
+
+
+def test_exact_hit_and_miss():
+    """Test exact-match get/set."""
+    cache = LLMCache()
+    key = make_cache_key("m", "hello")
+
+    assert asyncio.run(cache.get(key)) is None
+    asyncio.run(cache.set(key, "answer"))
+    assert asyncio.run(cache.get(key)) == "answer"
+
+
+def test_lru_eviction():
+    """Test that the LRU backend evicts the least recently used entry."""
+    backend = InMemoryLRUBackend(max_size=2)
+
+    async def scenario():
+        await backend.set("a", 1)
+        await backend.set("b", 2)
+        await backend.get("a")
+        await backend.set("c", 3)
+        return await backend.get("a"), await backend.get("b"), await backend.get("c")
+
+    assert asyncio.run(scenario()) == (1, None, 3)
+
+
+def test_ttl_expiry():
+    """Test that expired entries are not returned."""
+    backend = InMemoryLRUBackend()
+    asyncio.run(backend.set("k", "v", ttl=-1))
+    assert asyncio.run(backend.get("k")) is None
+
+
+def test_semantic_hit():
+    """Test that a similar prompt is served from the cache."""
+    vectors = {"make a sorter": [1.0, 0.0], "make a sort func": [0.99, 0.05]}
+    cache = LLMCache(embed=lambda text: vectors.get(text, [0.0, 1.0]))
+
+    asyncio.run(cache.set(make_cache_key("m", "make a sorter"), "cached", prompt="make a sorter"))
+
+    hit = asyncio.run(cache.get(make_cache_key("m", "make a sort func"), prompt="make a sort func"))
+    miss = asyncio.run(cache.get(make_cache_key("m", "unrelated"), prompt="unrelated"))
+    assert hit == "cached"
+    assert miss is None
+
+
+def test_semantic_lookup_without_numpy(monkeypatch):
+    """Test the pure-Python similarity fallback."""
+    import coding_agent.tools.llm_cache as llm_cache
+
+    monkeypatch.setattr(llm_cache, "np", None)
+    vectors = {"make a sorter": [1.0, 0.0], "make a sort func": [0.99, 0.05]}
+    cache = LLMCache(embed=lambda text: vectors.get(text, [0.0, 1.0]), max_semantic_entries=1)
+
+    asyncio.run(cache.set(make_cache_key("m", "make a sorter"), "cached", prompt="make a sorter"))
+    asyncio.run(cache.set(make_cache_key("m", "other"), "other", prompt="other"))
+
+    # The first entry was evicted from the semantic index
+    assert asyncio.run(cache.get(make_cache_key("m", "make a sort func"), prompt="make a sort func")) is None
+    assert asyncio.run(cache.get(make_cache_key("m", "x"), prompt="x")) == "other"
+
+
+def test_anthropic_client_coalesces_inflight_requests(monkeypatch):
+    """Test that concurrent identical prompts share one API call."""
+    import coding_agent.tools.llm_client as llm_client
+
+    calls = []
+
+    class FakeMessages:
+        async def create(self, **request):
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            text = type("Block", (), {"text": "reply"})()
+            return type("Message", (), {"content": [text]})()
+
+    class FakeAnthropic:
+        def __init__(self, **kwargs):
+            self.messages = FakeMessages()
+
+    monkeypatch.setattr(llm_client, "AsyncAnthropic", FakeAnthropic)
+    client = llm_client.AnthropicClient(
+        base_url="http://test", auth_token="t", http_client=object(), cache_enabled=False
+    )
+
+    async def burst():
+        return await asyncio.gather(*(client.generate_text("hello") for _ in range(5)))
+
+    assert asyncio.run(burst()) == ["reply"] * 5
+    assert len(calls) == 1
+    assert client._inflight == {}
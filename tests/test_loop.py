@@ -0,0 +1,34 @@
+"""Tests for AgenticLoop action dispatch."""
+
+import asyncio
+
+from coding_agent.actions.base import BaseAction
+from coding_agent.core.loop import AgenticLoop
+from coding_agent.core.state import AgentState
+
+
+class FakeSearchAction(BaseAction):
+    """Search action that records how often it runs."""
+
+    def __init__(self):
+        super().__init__(name="web_search", description="Fake search")
+        self.runs = 0
+
+    async def execute(self, state: AgentState, **kwargs):
+        self.runs += 1
+        return {"searched_step": state.current_step, "search_results": []}
+
+    def can_execute(self, state: AgentState) -> bool:
+        return True
+
+
+def test_planned_step_searches_once():
+    """Test that the loop moves on to code generation after one search."""
+    loop = AgenticLoop(enable_web_search=True)
+    search = FakeSearchAction()
+    loop.register_action(search)
+
+    state = asyncio.run(loop.run("Create a Python function to add two numbers"))
+
+    assert state.generated_code
+    assert search.runs == 2  # once at start, once after planning
@@ -0,0 +1,47 @@
+"""Tests for WebSearchAction."""
+
+import asyncio
+
+from coding_agent.actions.search import WebSearchAction
+from coding_agent.core.state import AgentState, Task
+from coding_agent.tools.web_crawler import WebPage
+from coding_agent.tools.web_search import SearchResult
+
+
+def test_task_queries_follow_keyword_priority():
+    """Test that function/class outrank api, which outranks database."""
+    state = AgentState(user_request="Test", analysis="analysis")
+    state.add_task(Task(id="1", content="Create database API endpoint"))
+    state.add_task(Task(id="2", content="Add database api helper function"))
+
+    queries = WebSearchAction()._generate_search_queries(state)
+
+    assert queries == [
+        "how to create Create database API endpoint",
+        "python Add database api helper function example implementation",
+    ]
+
+
+def test_crawl_results_follow_url_order():
+    """Test that crawl results keep queue order when later URLs finish first."""
+    urls = [f"https://example.com/crawl-order/{i}" for i in range(2)]
+
+    class FakeSearch:
+        async def search(self, query, max_results=3):
+            return [SearchResult("title", url, "snippet", "ddgs") for url in urls]
+
+    class FakeCrawler:
+        prefer_async = True
+
+        async def fetch(self, url, extract_text=True):
+            # Earlier URLs take longer, so they complete last
+            await asyncio.sleep(0.02 * (len(urls) - urls.index(url)))
+            return WebPage(url=url, status_code=200)
+
+    action = WebSearchAction(max_crawl_urls=3)
+    action.search_tool = FakeSearch()
+    action.crawler_tool = FakeCrawler()
+
+    result = asyncio.run(action.execute(AgentState(user_request="crawl order check")))
+
+    assert [entry["url"] for entry in result["crawl_results"]] == urls
@@ -22,9 +22,14 @@ def test_agent_state_initialization():
     assert state.current_step == "start"
 
 
-def test_add_task():
+@pytest.fixture
+def state():
+    """Fresh AgentState for a test to mutate."""
+    return AgentState(user_request="Test")
+
+
+def test_add_task(state):
     """Test adding tasks to state."""
-    state = AgentState(user_request="Test")
     task = Task(id="1", content="Task 1", priority="high")
     
     state.add_task(task)
@@ -32,26 +37,74 @@ def test_add_task():
     assert state.todo_list[0].content == "Task 1"
 
 
-def test_update_task_status():
-    """Test updating task status."""
-    state = AgentState(user_request="Test")
-    task = Task(id="1", content="Task 1", priority="high")
-    state.add_task(task)
-    
-    state.update_task_status("1", TaskStatus.COMPLETED)
-    assert state.todo_list[0].status == TaskStatus.COMPLETED
+@pytest.fixture
+def state_with_two_tasks(state):
+    """AgentState holding two pending tasks."""
+    state.add_task(Task(id="1", content="Task 1", priority="high"))
+    state.add_task(Task(id="2", content="Task 2", priority="medium"))
+    return state
 
 
-def test_get_pending_tasks():
+def test_get_pending_tasks(state_with_two_tasks):
     """Test getting pending tasks."""
-    state = AgentState(user_request="Test")
-    state.add_task(Task(id="1", content="Task 1", priority="high"))
-    state.add_task(Task(id="2", content="Task 2", priority="medium"))
-    
-    pending = state.get_pending_tasks()
-    assert len(pending) == 2
-    
+    pending = state_with_two_tasks.get_pending_tasks()
+    assert [t.id for t in pending] == ["1", "2"]
+
+
+@pytest.mark.parametrize(
+    "new_status,expected_pending",
+    [
+        (TaskStatus.COMPLETED, ["2"]),
+        (TaskStatus.IN_PROGRESS, ["2"]),
+        (TaskStatus.FAILED, ["2"]),
+        (TaskStatus.PENDING, ["1", "2"]),
+    ],
+)
+def test_update_task_status(state_with_two_tasks, new_status, expected_pending):
+    """Test updating task status and the resulting pending tasks."""
+    state = state_with_two_tasks
+    state.update_task_status("1", new_status)
+
+    assert state.todo_list[0].status == new_status
+    assert [t.id for t in state.get_pending_tasks()] == expected_pending
+
+
+def test_update_task_status_with_initial_todo_list():
+    """Test updating a task passed in at construction time."""
+    state = AgentState(user_request="Test", todo_list=[Task(id="1", content="Task 1")])
+
     state.update_task_status("1", TaskStatus.COMPLETED)
-    pending = state.get_pending_tasks()
-    assert len(pending) == 1
-    assert pending[0].id == "2"
\ No newline at end of file
+    state.update_task_status("missing", TaskStatus.COMPLETED)
+    assert state.todo_list[0].status == TaskStatus.COMPLETED
+
+
+def test_pending_tasks_follow_status_changes():
+    """Test that pending tasks are tracked as statuses change."""
+    state = AgentState(
+        user_request="Test",
+        todo_list=[Task(id="1", content="Task 1"), Task(id="2", content="Task 2", status=TaskStatus.COMPLETED)],
+    )
+    assert [t.id for t in state.get_pending_tasks()] == ["1"]
+
+    state.update_task_status("1", TaskStatus.IN_PROGRESS)
+    assert state.get_pending_tasks() == []
+
+    state.update_task_status("2", TaskStatus.PENDING)
+    state.add_task(Task(id="3", content="Task 3"))
+    assert [t.id for t in state.get_pending_tasks()] == ["2", "3"]
+
+
+def test_pending_tasks_after_direct_status_changes(state):
+    """Test pending tasks when statuses are also set directly."""
+    completed = Task(id="a", content="A")
+    untracked = Task(id="b", content="B", status=TaskStatus.COMPLETED)
+    state.add_task(completed)
+    state.add_task(untracked)
+
+    # Re-pending a task completed directly doesn't list it twice
+    completed.status = TaskStatus.COMPLETED
+    state.update_task_status("a", TaskStatus.PENDING)
+    # A task added as non-pending and set to pending directly is listed
+    untracked.status = TaskStatus.PENDING
+
+    assert [t.id for t in state.get_pending_tasks()] == ["a", "b"]
@@ -0,0 +1,83 @@
+"""Tests for ToolExecutor's code runner."""
+
+import asyncio
+
+import coding_agent.tools.tool_executor as tool_executor
+from coding_agent.tools.tool_executor import ToolExecutor
+
+
+def test_code_runner_isolates_snippets():
+    """Test that one snippet's changes don't carry into the next."""
+    executor = ToolExecutor()
+
+    async def run():
+        first = await executor.execute_code_runner(
+            "python",
+            "import builtins, os\nos.environ['LEAK'] = '1'\n"
+            "builtins.print = lambda *a, **k: None",
+        )
+        second = await executor.execute_code_runner(
+            "python", "import os\nprint(os.environ.get('LEAK'))"
+        )
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first["success"] is True
+    assert second["stdout"] == "None\n"
+
+
+def test_code_runner_captures_child_process_output():
+    """Test that output written by child processes is captured."""
+    result = asyncio.run(
+        ToolExecutor().execute_code_runner("python", "import os\nos.system('echo hi')")
+    )
+    assert result["stdout"] == "hi\n"
+
+
+def test_code_runner_reports_errors():
+    """Test exit codes and tracebacks from failing snippets."""
+    executor = ToolExecutor()
+
+    async def run():
+        raised = await executor.execute_code_runner("python", "1 / 0")
+        exited = await executor.execute_code_runner("python", "import sys\nsys.exit(3)")
+        return raised, exited
+
+    raised, exited = asyncio.run(run())
+    assert raised["success"] is False
+    assert "ZeroDivisionError" in raised["stderr"]
+    assert exited["returncode"] == 3
+
+
+def test_code_runner_kills_child_on_cancel(monkeypatch):
+    """Test that cancelling a run kills the interpreter it started."""
+    procs = []
+    create = asyncio.create_subprocess_exec
+
+    async def create_and_record(*args, **kwargs):
+        proc = await create(*args, **kwargs)
+        procs.append(proc)
+        return proc
+
+    monkeypatch.setattr(tool_executor.asyncio, "create_subprocess_exec", create_and_record)
+
+    async def run():
+        task = asyncio.ensure_future(
+            ToolExecutor().execute_code_runner("python", "import time\ntime.sleep(30)")
+        )
+        while not procs:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return procs[0].returncode
+
+    assert asyncio.run(run()) is not None
+
+
+def test_code_runner_rejects_unknown_language():
+    """Test that unsupported languages are rejected."""
+    result = asyncio.run(ToolExecutor().execute_code_runner("ruby", "puts 1"))
+    assert result == {"success": False, "error": "Unsupported language: ruby"}
@@ -0,0 +1,227 @@
+"""Tests for WebCrawler fetching and HTML parsing."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+import coding_agent.tools.web_crawler as web_crawler
+from coding_agent.tools.web_crawler import WebCrawler
+
+HTML = """
+<html>
+    <head><title> Test Page </title><style>p {}</style></head>
+    <body>
+        <nav>Home</nav>
+        <h1>Main Title</h1>
+        <p>This is a test paragraph.</p>
+        <script>console.log('script');</script>
+    </body>
+</html>
+"""
+
+
+@pytest.fixture(params=["selectolax", "bs4"])
+def crawler(request, monkeypatch):
+    if request.param == "selectolax":
+        if web_crawler.LexborHTMLParser is None:
+            pytest.skip("selectolax not installed")
+    else:
+        if web_crawler.BeautifulSoup is None:
+            pytest.skip("beautifulsoup4 not installed")
+        monkeypatch.setattr(web_crawler, "LexborHTMLParser", None)
+    return WebCrawler()
+
+
+def test_parse_html_extracts_text_and_title(crawler):
+    """Test that one parse yields the visible text and the title."""
+    parsed = crawler._parse_html(HTML)
+
+    assert parsed.title == "Test Page"
+    assert parsed.text.splitlines() == ["Test Page", "Main Title", "This is a test paragraph."]
+
+
+def test_parse_html_title_only_and_limit(crawler):
+    """Test skipping text extraction and stopping at max_chars."""
+    assert crawler._parse_html(HTML, extract_text=False) == (None, "Test Page")
+    assert crawler._extract_text(HTML, max_chars=12) == "Test Page\nMa"
+
+
+def test_binary_response_is_not_decoded():
+    """Test that non-text bodies are measured but not decoded."""
+
+    class Response:
+        status_code = 200
+        headers = {"content-type": "image/png"}
+        content = b"\x89PNG" * 10
+
+        @property
+        def text(self):
+            raise AssertionError("binary body was decoded")
+
+    page = WebCrawler()._process_response(Response(), "https://example.com/a.png", True)
+
+    assert page.content is None
+    assert page.to_dict()["content_length"] == 40
+
+
+def test_fetch_stops_reading_at_max_bytes():
+    """Test that a large body is cut at max_bytes while streaming."""
+    def handler(request):
+        body = b"<html><title>Big</title><body>" + b"x" * 10_000 + b"</body></html>"
+        return httpx.Response(200, headers={"content-type": "text/html"}, content=body)
+
+    async def fetch():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            crawler = WebCrawler(client=client, max_bytes=1000)
+            return await crawler.fetch("https://example.com/", extract_text=False)
+
+    page = asyncio.run(fetch())
+
+    assert page.status_code == 200
+    assert page.title == "Big"
+    assert len(page.content) == 1000
+
+
+def test_fetch_multiple_bounds_concurrency():
+    """Test that at most max_concurrent fetches run and every URL is returned."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        return httpx.Response(200, headers={"content-type": "text/plain"}, text=request.url.path)
+
+    urls = [f"https://example.com/{i}" for i in range(30)]
+    requested = []
+
+    async def fetch():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            crawler = WebCrawler(client=client)
+            original = crawler.fetch
+
+            async def fetch_one(url, extract_text=True):
+                requested.append(url)
+                return await original(url, extract_text)
+
+            crawler.fetch = fetch_one
+            # Duplicates are fetched once
+            return await crawler.fetch_multiple(urls + urls[:5], max_concurrent=4)
+
+    pages = asyncio.run(fetch())
+
+    assert list(pages) == urls
+    assert sorted(requested) == sorted(urls)
+    assert [page.text for page in pages.values()] == [f"/{i}" for i in range(30)]
+    assert peak <= 4
+
+
+def test_fetch_multiple_iter_surfaces_dead_worker():
+    """Test that a worker killed by a BaseException fails the iterator instead of hanging it."""
+
+    class WorkerKilled(BaseException):
+        pass
+
+    async def fetch_one(url, extract_text=True):
+        if url.endswith("/1"):
+            raise WorkerKilled()
+        return web_crawler.WebPage(url=url)
+
+    async def consume():
+        crawler = WebCrawler()
+        crawler.fetch = fetch_one
+        urls = [f"https://example.com/{i}" for i in range(3)]
+        return [url async for url, _ in crawler.fetch_multiple_iter(urls, max_concurrent=1)]
+
+    with pytest.raises(WorkerKilled):
+        asyncio.run(asyncio.wait_for(consume(), timeout=5))
+
+
+def test_rps_limit_spaces_requests():
+    """Test that requests beyond the initial burst wait for tokens."""
+
+    def handler(request):
+        return httpx.Response(200, headers={"content-type": "text/plain"}, text="ok")
+
+    urls = [f"https://example.com/{i}" for i in range(60)]
+
+    async def fetch():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            crawler = WebCrawler(client=client, rps=50)
+            start = time.monotonic()
+            await crawler.fetch_multiple(urls)
+            return time.monotonic() - start
+
+    # 50 requests go out in the first burst; the other 10 take 0.2s of tokens
+    assert asyncio.run(fetch()) >= 0.18
+
+
+def test_fetch_retries_rate_limited_responses():
+    """Test that 429/503 responses are retried until one succeeds."""
+    statuses = [429, 503, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), headers={"content-type": "text/plain"}, text="ok")
+
+    async def fetch():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            crawler = WebCrawler(client=client, max_retries=2)
+            crawler.RETRY_BACKOFF = 0
+            return await crawler.fetch("https://example.com/")
+
+    page = asyncio.run(fetch())
+
+    assert page.status_code == 200
+    assert page.text == "ok"
+    assert statuses == []
+
+
+def test_refetch_revalidates_with_etag():
+    """Test that a cached page is reused when the server answers 304."""
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, headers={"content-type": "text/plain", "etag": '"v1"'}, text="body"
+        )
+
+    async def fetch_twice():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            crawler = WebCrawler(client=client)
+            first = await crawler.fetch("https://example.com/")
+            second = await crawler.fetch("https://example.com/")
+            return first, second
+
+    first, second = asyncio.run(fetch_twice())
+
+    assert requests_seen == [None, '"v1"']
+    assert second.text == first.text == "body"
+    assert second.status_code == 200
+
+
+def test_owned_client_is_rebuilt_for_each_event_loop(monkeypatch):
+    """Test that a crawler keeps working across asyncio.run calls."""
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text="ok"))
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        httpx, "AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs)
+    )
+    crawler = WebCrawler()
+    clients = []
+
+    async def fetch():
+        page = await crawler.fetch("https://example.com/", extract_text=False)
+        clients.append(crawler._client)
+        return page.status_code
+
+    assert asyncio.run(fetch()) == 200
+    assert asyncio.run(fetch()) == 200
+    assert clients[0] is not clients[1]
@@ -1,70 +1,282 @@
 """验证 tools use 实现。
 
 这个脚本直接检查文件是否存在以及代码结构是否正确。
+检查基于源码解析而不导入被检查的模块：导入会执行模块代码并加载 httpx、
+HTML 解析器等依赖，比解析更慢，且依赖未安装时无法运行。
 """
 
 import os
+import re
+import sys
+import json
+import hashlib
+import argparse
 import ast
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+TOOL_DEF_FILE = "src/coding_agent/tools/tool_definitions.py"
+TOOL_EXEC_FILE = "src/coding_agent/tools/tool_executor.py"
+LLM_CLIENT_FILE = "src/coding_agent/tools/llm_client.py"
+
+# 代码结构检查表：(标题, [(类型, 文件, 参数...)])；文件不存在时跳过该项
+CHECKS = [
+    ("\n🔧 检查工具定义:", [
+        ("func", TOOL_DEF_FILE, "get_web_search_tool_definition"),
+        ("func", TOOL_DEF_FILE, "get_web_crawler_tool_definition"),
+        ("func", TOOL_DEF_FILE, "get_code_runner_tool_definition"),
+        ("func", TOOL_DEF_FILE, "get_all_tool_definitions"),
+    ]),
+    ("\n⚙️  检查工具执行器:", [
+        ("method", TOOL_EXEC_FILE, "ToolExecutor", "execute_web_search"),
+        ("method", TOOL_EXEC_FILE, "ToolExecutor", "execute_web_crawl"),
+        ("method", TOOL_EXEC_FILE, "ToolExecutor", "execute_code_runner"),
+    ]),
+    ("\n🤖 检查 LLM 客户端:", [
+        ("method", LLM_CLIENT_FILE, "AnthropicClient", "register_tool"),
+        ("method", LLM_CLIENT_FILE, "AnthropicClient", "generate_with_tools"),
+        ("method", LLM_CLIENT_FILE, "AnthropicClient", "_execute_tool"),
+    ]),
+    ("\n📝 检查关键代码:", [
+        ("contains", TOOL_DEF_FILE, b'"type": "function"', "工具定义包含正确的类型", "工具定义缺少类型"),
+        ("contains", TOOL_DEF_FILE, b'code_runner', "包含 code_runner 工具", "缺少 code_runner 工具"),
+        ("contains", LLM_CLIENT_FILE, b'tool_registry', "包含工具注册表", "缺少工具注册表"),
+        ("contains", LLM_CLIENT_FILE, b'stop_reason == "tool_use"', "包含工具调用处理逻辑", "缺少工具调用处理逻辑"),
+    ]),
+]
+
+# 普通函数与异步函数节点
+_FUNC_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# 按文件内容哈希保存的检查结果，文件未改动时直接复用
+VERIFY_CACHE_FILE = ".verify_cache.json"
+_CACHE_VERSION = 2
+
+# "检查关键代码" 中的全部关键字，每个文件只扫描一遍
+_MARKERS = frozenset(
+    check[2] for _, checks in CHECKS for check in checks if check[0] == "contains"
+)
+_MARKER_RE = re.compile(b"|".join(map(re.escape, sorted(_MARKERS, key=len, reverse=True))))
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_entries(directory):
+    """列出目录项并缓存；每个目录只扫描一次，代替逐个 stat()。"""
+    directory = directory or "."
+    return frozenset(os.listdir(directory)) if os.path.isdir(directory) else frozenset()
+
+
+def _file_exists(filepath):
+    """通过所在目录的缓存列表判断文件是否存在。"""
+    directory, name = os.path.split(filepath)
+    return name in _dir_entries(directory)
 
 
 def check_file_exists(filepath):
-    """检查文件是否存在。"""
-    exists = os.path.exists(filepath)
+    """检查文件是否存在，返回 (是否通过, 输出行)。"""
+    exists = _file_exists(filepath)
     status = "✅" if exists else "❌"
-    print(f"{status} {filepath}")
-    return exists
+    return exists, f"{status} {filepath}"
+
+
+def _read_bytes(filepath, size):
+    """绕过缓冲 IO 层，按 stat 得到的大小直接读取文件字节。"""
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, 1 << 16))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse(filepath, mtime_ns, size):
+    """读取并解析文件，返回 (源码字节, AST)；以修改时间和大小为键缓存，文件改动后自动失效。"""
+    source = _read_bytes(filepath, size)
+    # 只需要顶层定义，optimize=2 允许丢弃文档字符串和 assert
+    tree = compile(source, filepath, 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True, optimize=2)
+    return source, tree
+
+
+def _index_module(tree):
+    """建立名称到节点的索引：顶层函数与顶层类。
+
+    类体不在此展开，只有被查询的类才会扫描其方法。
+    """
+    funcs = {}
+    classes = {}
+    for node in tree.body:
+        if isinstance(node, _FUNC_TYPES):
+            funcs[node.name] = node
+        elif isinstance(node, ast.ClassDef):
+            classes[node.name] = node
+    return funcs, classes
+
+
+def _find_method(class_node, method_name):
+    """在类体中查找方法，找到第一个即返回。"""
+    return next(
+        (item for item in class_node.body
+         if isinstance(item, _FUNC_TYPES) and item.name == method_name),
+        None,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _index(filepath, mtime_ns, size):
+    """与 AST 一同缓存的索引，键同 _parse。"""
+    return _index_module(_parse(filepath, mtime_ns, size)[1])
+
+
+def _load_index(filepath):
+    """返回文件的 (funcs, classes) 索引，同一文件只构建一次。"""
+    st = os.stat(filepath)
+    return _index(filepath, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _markers(filepath, mtime_ns, size):
+    """复用已缓存的源码，一次正则扫描找出出现的关键字；全部找到后提前结束。"""
+    found = set()
+    for match in _MARKER_RE.finditer(_parse(filepath, mtime_ns, size)[0]):
+        found.add(match.group())
+        if len(found) == len(_MARKERS):
+            break
+    return frozenset(found)
+
+
+def _load_markers(filepath):
+    """返回文件中出现的关键字集合，无需再次读取文件。"""
+    st = os.stat(filepath)
+    return _markers(filepath, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=None)
+def _digest(filepath, mtime_ns, size):
+    """文件内容的 SHA-256，用作结果缓存的键。"""
+    return hashlib.sha256(_read_bytes(filepath, size)).hexdigest()
+
+
+def _check_key(kind, filepath, *args):
+    """结果缓存的键：文件内容哈希 + 检查类型 + 参数。"""
+    st = os.stat(filepath)
+    return f"{_digest(filepath, st.st_mtime_ns, st.st_size)}:{kind}:{args!r}"
+
+
+def _load_cache():
+    """读取上次运行的结果缓存；文件缺失或损坏时返回空缓存。"""
+    try:
+        with open(VERIFY_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    return data.get("results", {})
+
+
+def _save_cache(cache):
+    """写回结果缓存；写入失败不影响检查结果。"""
+    try:
+        with open(VERIFY_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"version": _CACHE_VERSION, "results": cache}, f, ensure_ascii=False)
+    except OSError:
+        pass
+
+
+def _run_check(cache, used, kind, filepath, *args):
+    """执行一项检查，返回 (是否通过, 输出行)；命中缓存时不再解析文件。"""
+    key = _check_key(kind, filepath, *args)
+    if key in cache:
+        passed, message = cache[key]
+    else:
+        passed, message = _CHECKERS[kind](filepath, *args)
+    used[key] = [passed, message]
+    return passed, message
+
+
+def _preload(filepath):
+    """预先读取、解析并索引文件；出错时留给各检查函数报告。"""
+    try:
+        _load_index(filepath)
+        _load_markers(filepath)
+    except Exception:
+        pass
 
 
 def check_function_in_file(filepath, function_name):
-    """检查文件中是否包含指定函数。"""
+    """检查文件中是否包含指定函数，返回 (是否通过, 输出行)。"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            tree = ast.parse(f.read())
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.name == function_name:
-                print(f"  ✅ 函数 {function_name} 存在")
-                return True
-        
-        print(f"  ❌ 函数 {function_name} 不存在")
-        return False
+        funcs, _ = _load_index(filepath)
+
+        if function_name in funcs:
+            return True, f"  ✅ 函数 {function_name} 存在"
+
+        return False, f"  ❌ 函数 {function_name} 不存在"
     except Exception as e:
-        print(f"  ❌ 检查失败: {e}")
-        return False
+        return False, f"  ❌ 检查失败: {e}"
 
 
 def check_class_method_in_file(filepath, class_name, method_name):
-    """检查文件中的类是否包含指定方法。"""
+    """检查文件中的类是否包含指定方法，返回 (是否通过, 输出行)。"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            tree = ast.parse(f.read())
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name == class_name:
-                for item in node.body:
-                    # 检查普通函数和异步函数
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name == method_name:
-                        func_type = "async " if isinstance(item, ast.AsyncFunctionDef) else ""
-                        print(f"  ✅ {class_name}.{func_type}{method_name} 存在")
-                        return True
-
-        print(f"  ❌ {class_name}.{method_name} 不存在")
-        return False
+        _, classes = _load_index(filepath)
+
+        class_node = classes.get(class_name)
+        item = _find_method(class_node, method_name) if class_node is not None else None
+        if item is not None:
+            func_type = "async " if isinstance(item, ast.AsyncFunctionDef) else ""
+            return True, f"  ✅ {class_name}.{func_type}{method_name} 存在"
+
+        return False, f"  ❌ {class_name}.{method_name} 不存在"
     except Exception as e:
-        print(f"  ❌ 检查失败: {e}")
-        return False
+        return False, f"  ❌ 检查失败: {e}"
+
 
+def check_contains(filepath, needle, found_msg, missing_msg):
+    """检查文件源码中是否包含指定关键字，返回 (是否通过, 输出行)。"""
+    if needle in _load_markers(filepath):
+        return True, f"  ✅ {found_msg}"
+    return False, f"  ❌ {missing_msg}"
 
-def main():
-    """主函数。"""
-    print("\n" + "=" * 60)
-    print("验证 Tools Use 功能实现")
-    print("=" * 60)
+
+_CHECKERS = {
+    "func": check_function_in_file,
+    "method": check_class_method_in_file,
+    "contains": check_contains,
+}
+
+
+def main(fail_fast=False):
+    """主函数。
+
+    Args:
+        fail_fast: 为 True 时遇到第一个失败的检查即停止
+    """
+    # 输出先缓冲，结束时一次写出
+    lines = []
+    try:
+        return _verify(lines, fail_fast)
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _verify(lines, fail_fast):
+    """执行全部检查，输出行追加到 lines。"""
+    emit = lines.append
+    emit("\n" + "=" * 60)
+    emit("验证 Tools Use 功能实现")
+    emit("=" * 60)
     
-    results = []
+    passed = total = 0
     
     # 1. 检查新增文件
-    print("\n📁 检查新增文件:")
+    emit("\n📁 检查新增文件:")
     files_to_check = [
         "src/coding_agent/tools/tool_definitions.py",
         "src/coding_agent/tools/tool_executor.py",
@@ -73,99 +285,78 @@ def main():
         "docs/TOOL_USE.md",
         "docs/TOOLS_USE_IMPLEMENTATION.md",
     ]
+    # 去重并保持原顺序，每个文件只检查一次
+    files_to_check = list(dict.fromkeys(files_to_check))
+
+    # 预先按目录批量扫描
+    for directory in {os.path.dirname(p) for p in files_to_check}:
+        _dir_entries(directory)
     
     for filepath in files_to_check:
-        results.append(check_file_exists(filepath))
+        ok, message = check_file_exists(filepath)
+        emit(message)
+        total += 1
+        passed += ok
+        if fail_fast and not ok:
+            emit("\n⛔ 检查失败，已停止 (--fail-fast)")
+            return False
     
-    # 2. 检查 tool_definitions.py 中的函数
-    print("\n🔧 检查工具定义:")
-    tool_def_file = "src/coding_agent/tools/tool_definitions.py"
-    if os.path.exists(tool_def_file):
-        results.append(check_function_in_file(tool_def_file, "get_web_search_tool_definition"))
-        results.append(check_function_in_file(tool_def_file, "get_web_crawler_tool_definition"))
-        results.append(check_function_in_file(tool_def_file, "get_code_runner_tool_definition"))
-        results.append(check_function_in_file(tool_def_file, "get_all_tool_definitions"))
-    
-    # 3. 检查 tool_executor.py 中的类和方法
-    print("\n⚙️  检查工具执行器:")
-    tool_exec_file = "src/coding_agent/tools/tool_executor.py"
-    if os.path.exists(tool_exec_file):
-        results.append(check_class_method_in_file(tool_exec_file, "ToolExecutor", "execute_web_search"))
-        results.append(check_class_method_in_file(tool_exec_file, "ToolExecutor", "execute_web_crawl"))
-        results.append(check_class_method_in_file(tool_exec_file, "ToolExecutor", "execute_code_runner"))
-    
-    # 4. 检查 llm_client.py 中的新方法
-    print("\n🤖 检查 LLM 客户端:")
-    llm_client_file = "src/coding_agent/tools/llm_client.py"
-    if os.path.exists(llm_client_file):
-        results.append(check_class_method_in_file(llm_client_file, "AnthropicClient", "register_tool"))
-        results.append(check_class_method_in_file(llm_client_file, "AnthropicClient", "generate_with_tools"))
-        results.append(check_class_method_in_file(llm_client_file, "AnthropicClient", "_execute_tool"))
-    
-    # 5. 检查代码内容
-    print("\n📝 检查关键代码:")
-    
-    # 检查 tool_definitions.py 中的工具定义格式
-    if os.path.exists(tool_def_file):
-        with open(tool_def_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if '"type": "function"' in content:
-                print("  ✅ 工具定义包含正确的类型")
-                results.append(True)
-            else:
-                print("  ❌ 工具定义缺少类型")
-                results.append(False)
-            
-            if 'code_runner' in content:
-                print("  ✅ 包含 code_runner 工具")
-                results.append(True)
-            else:
-                print("  ❌ 缺少 code_runner 工具")
-                results.append(False)
-    
-    # 检查 llm_client.py 中的 tools use 逻辑
-    if os.path.exists(llm_client_file):
-        with open(llm_client_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if 'tool_registry' in content:
-                print("  ✅ 包含工具注册表")
-                results.append(True)
-            else:
-                print("  ❌ 缺少工具注册表")
-                results.append(False)
-            
-            if 'stop_reason == "tool_use"' in content:
-                print("  ✅ 包含工具调用处理逻辑")
-                results.append(True)
-            else:
-                print("  ❌ 缺少工具调用处理逻辑")
-                results.append(False)
+    # 2. 检查代码结构与关键代码；只解析缓存未命中的文件，
+    # 各文件的读取与解析互不依赖，先并行预加载
+    cache = _load_cache()
+    used = {}
+    stale = {
+        check[1] for _, checks in CHECKS for check in checks
+        if _file_exists(check[1]) and _check_key(*check) not in cache
+    }
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_preload, stale))
+
+    try:
+        for title, checks in CHECKS:
+            emit(title)
+            for kind, filepath, *args in checks:
+                if _file_exists(filepath):
+                    ok, message = _run_check(cache, used, kind, filepath, *args)
+                else:
+                    # 文件缺失时依赖它的检查直接记为失败，不再打开文件
+                    ok, message = False, f"  ❌ 文件不存在: {filepath}"
+                emit(message)
+                total += 1
+                passed += ok
+                if fail_fast and not ok:
+                    emit("\n⛔ 检查失败，已停止 (--fail-fast)")
+                    return False
+    finally:
+        # 只保留本次用到的条目，旧内容的结果随之淘汰
+        _save_cache(used)
     
     # 总结
-    print("\n" + "=" * 60)
-    print("📊 验证总结")
-    print("=" * 60)
-    passed = sum(results)
-    total = len(results)
-    print(f"通过: {passed}/{total}")
+    emit("\n" + "=" * 60)
+    emit("📊 验证总结")
+    emit("=" * 60)
+    emit(f"通过: {passed}/{total}")
     
     if passed == total:
-        print("\n✅ 所有检查通过！")
-        print("\nTools Use 功能已成功实现，包括:")
-        print("  ✓ 工具定义模块 (tool_definitions.py)")
-        print("  ✓ 工具执行器 (tool_executor.py)")
-        print("  ✓ LLM 客户端 tools use 方法")
-        print("  ✓ 示例代码和文档")
-        print("\n使用方法请参考:")
-        print("  - docs/TOOL_USE.md")
-        print("  - examples/simple_tool_use.py")
+        emit("\n✅ 所有检查通过！")
+        emit("\nTools Use 功能已成功实现，包括:")
+        emit("  ✓ 工具定义模块 (tool_definitions.py)")
+        emit("  ✓ 工具执行器 (tool_executor.py)")
+        emit("  ✓ LLM 客户端 tools use 方法")
+        emit("  ✓ 示例代码和文档")
+        emit("\n使用方法请参考:")
+        emit("  - docs/TOOL_USE.md")
+        emit("  - examples/simple_tool_use.py")
     else:
-        print(f"\n⚠️  {total - passed} 个检查失败")
+        emit(f"\n⚠️  {total - passed} 个检查失败")
     
     return passed == total
 
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="验证 tools use 实现")
+    parser.add_argument("--fail-fast", action="store_true", help="遇到第一个失败的检查即退出")
+    args = parser.parse_args()
+    success = main(fail_fast=args.fail_fast)
     exit(0 if success else 1)
 